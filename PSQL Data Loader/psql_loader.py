@@ -1,8 +1,10 @@
 import os
 import re
-import psycopg2
 import csv
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from psycopg2 import sql
+from psycopg2.pool import ThreadedConnectionPool
 
 DB_HOST = "localhost"
 DB_NAME = "labor_market"
@@ -10,18 +12,30 @@ DB_USER = "postgres"
 DB_PASSWORD = ""
 DB_PORT = "5432"
 
-def connect_to_db():
-    """Establish a connection to the PostgreSQL database."""
+# Number of CSV loads (and pooled connections) run concurrently.
+MAX_WORKERS = 8
+# Read size used when streaming CSV files to COPY.
+COPY_BUFFER_SIZE = 1 << 20
+# Successfully loaded files are committed in batches of this size.
+COMMIT_EVERY = 16
+
+_SANITIZE_RE = re.compile(r'[^0-9a-zA-Z_]')
+_LEADING_DIGIT_RE = re.compile(r'^[0-9]')
+
+def create_connection_pool(max_conn: int = MAX_WORKERS):
+    """Create a thread-safe pool of PostgreSQL connections."""
     try:
-        conn = psycopg2.connect(
+        pool = ThreadedConnectionPool(
+            1,
+            max_conn,
             host=DB_HOST,
             database=DB_NAME,
             user=DB_USER,
             password=DB_PASSWORD,
             port=DB_PORT
         )
-        print("Connection to database established.")
-        return conn
+        print("Connection pool to database established.")
+        return pool
     except Exception as e:
         print(f"Error connecting to database: {e}")
         return None
@@ -34,131 +48,171 @@ def sanitize_column(name: str) -> str:
     """
     name = (name or '').strip()
     name = name.replace(' ', '_')
-    name = re.sub(r'[^0-9a-zA-Z_]', '_', name)
-    if re.match(r'^[0-9]', name):
+    name = _SANITIZE_RE.sub('_', name)
+    if _LEADING_DIGIT_RE.match(name):
         name = '_' + name
     return name.lower() or 'col'
 
 
-def ensure_table_for_csv(path: str, table: str, cur):
+def ensure_table_for_csv(path: str, table: str, cur) -> bool:
     """Create a table named `table` if it doesn't exist, using the CSV header
     to define TEXT columns in the same order.
+
+    New tables are created UNLOGGED so the initial COPY skips WAL writes;
+    callers switch them to LOGGED once loading is done. Returns True if the
+    table was created by this call.
     """
     with open(path, newline='', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        header = next(reader, None)
-        if not header:
-            raise ValueError(f"CSV file {path} is empty or has no header")
-
-        cols = []
-        seen = {}
-        for raw in header:
-            col = sanitize_column(raw)
-            base = col
-            i = 1
-            while col in seen:
-                col = f"{base}_{i}"
-                i += 1
-            seen[col] = True
-            cols.append(col)
+        first = f.readline()
+        if '"' in first:
+            # Quoted header cells may contain commas or newlines; let the csv
+            # module handle those rather than splitting by hand.
+            f.seek(0)
+            header = next(csv.reader(f), None)
+        else:
+            line = first.rstrip('\r\n')
+            header = line.split(',') if line else None
+
+    if not header:
+        raise ValueError(f"CSV file {path} is empty or has no header")
+
+    # Disambiguate repeated names as base, base_1, base_2, ... Remembering the
+    # next suffix per base keeps this linear even for long runs of duplicates.
+    cols = []
+    seen = set()
+    next_suffix = {}
+    for raw in header:
+        base = sanitize_column(raw)
+        col = base
+        i = next_suffix.get(base, 1)
+        while col in seen:
+            col = f"{base}_{i}"
+            i += 1
+        next_suffix[base] = i
+        seen.add(col)
+        cols.append(col)
 
     # Check if table exists
     cur.execute("SELECT to_regclass(%s)", (table,))
     if cur.fetchone()[0]:
-        return
+        return False
 
     # Build CREATE TABLE statement with TEXT columns preserving order
     col_defs = [sql.SQL("{} text").format(sql.Identifier(c)) for c in cols]
-    create_sql = sql.SQL('CREATE TABLE {} (').format(sql.Identifier(table)) + sql.SQL(', ').join(col_defs) + sql.SQL(')')
+    create_sql = sql.SQL('CREATE UNLOGGED TABLE {} (').format(sql.Identifier(table)) + sql.SQL(', ').join(col_defs) + sql.SQL(')')
     cur.execute(create_sql)
+    return True
 
 
-def ingest_data(root_dir='.'):
-    """Recursively find CSV files under `root_dir` and load each into a table
-    whose name is the CSV filename (without extension) using PostgreSQL COPY.
+def find_csv_files(root_dir='.'):
+    """Recursively find CSV files under `root_dir`, grouped by target table
+    name (the CSV filename without extension).
     """
-    conn = connect_to_db()
-    if conn is None:
-        return
-
+    jobs = defaultdict(list)
+    for dirpath, dirnames, filenames in os.walk(root_dir):
+        for fname in filenames:
+            if not fname.lower().endswith('.csv'):
+                continue
+            table = os.path.splitext(fname)[0]
+            jobs[table].append(os.path.join(dirpath, fname))
+    return jobs
+
+
+def load_table(pool, table: str, paths: list, keep_unlogged: bool = False):
+    """Load every CSV in `paths` into `table` on one pooled connection.
+
+    Each file runs inside its own savepoint so a bad file is rolled back on
+    its own, while commits are batched every COMMIT_EVERY loaded files to
+    avoid paying a WAL flush per file. A table created here starts out
+    UNLOGGED and is set LOGGED after its last file unless `keep_unlogged`.
+    """
+    conn = pool.getconn()
     try:
         cur = conn.cursor()
-
-        for dirpath, dirnames, filenames in os.walk(root_dir):
-            for fname in filenames:
-                if not fname.lower().endswith('.csv'):
-                    continue
-
-                path = os.path.join(dirpath, fname)
-                table = os.path.splitext(fname)[0]
-
-                print(f"Loading {path} into table '{table}'...")
-                try:
-                    # Ensure table exists with columns inferred from CSV header
-                    ensure_table_for_csv(path, table, cur)
-
-                    with open(path, 'r', encoding='utf-8') as f:
-                        copy_sql = sql.SQL("COPY {} FROM STDIN WITH CSV HEADER").format(
-                            sql.Identifier(table)
-                        )
-                        cur.copy_expert(copy_sql.as_string(conn), f)
-                    conn.commit()
-                    print(f"Successfully loaded {path} -> {table}")
-                except Exception as e:
-                    conn.rollback()
-                    print(f"Failed to load {path} into {table}: {e}")
-
+        pending = 0
+        created = False
+        for path in paths:
+            if pending == 0:
+                # Bulk-load mode: don't wait for the WAL flush on commit.
+                cur.execute("SET LOCAL synchronous_commit = off")
+
+            print(f"Loading {path} into table '{table}'...")
+            cur.execute("SAVEPOINT load_csv")
+            try:
+                # Ensure table exists with columns inferred from CSV header
+                created_now = ensure_table_for_csv(path, table, cur)
+
+                # Stream raw bytes with a large buffer; the server decodes
+                # them as UTF-8, so there is no Python-side text decode.
+                with open(path, 'rb', buffering=COPY_BUFFER_SIZE) as f:
+                    if hasattr(os, 'posix_fadvise'):
+                        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    # A table created in this same savepoint can take FREEZE:
+                    # rows are written already frozen, so the first VACUUM and
+                    # hint-bit updates don't rewrite the freshly loaded pages.
+                    copy_options = "FORMAT csv, HEADER true, ENCODING 'UTF8'"
+                    if created_now:
+                        copy_options += ", FREEZE true"
+                    copy_sql = sql.SQL("COPY {} FROM STDIN WITH (" + copy_options + ")").format(
+                        sql.Identifier(table)
+                    )
+                    cur.copy_expert(copy_sql.as_string(conn), f, size=COPY_BUFFER_SIZE)
+                cur.execute("RELEASE SAVEPOINT load_csv")
+                created = created or created_now
+                pending += 1
+                print(f"Successfully loaded {path} -> {table}")
+            except Exception as e:
+                cur.execute("ROLLBACK TO SAVEPOINT load_csv")
+                print(f"Failed to load {path} into {table}: {e}")
+
+            if pending >= COMMIT_EVERY:
+                conn.commit()
+                pending = 0
+
+        conn.commit()
+
+        if created and not keep_unlogged:
+            # Rewrites the table into WAL once, which is still cheaper than
+            # logging every COPY batch, and makes it crash-safe again.
+            cur.execute(sql.SQL("ALTER TABLE {} SET LOGGED").format(sql.Identifier(table)))
+            conn.commit()
         cur.close()
     finally:
-        conn.close()
+        pool.putconn(conn)
 
 
-if __name__ == '__main__':
-    # Run ingestion from current working directory by default
-    ingest_data('.')
-
+def ingest_data(root_dir='.', max_workers: int = MAX_WORKERS, keep_unlogged: bool = False):
+    """Recursively find CSV files under `root_dir` and load each into a table
+    whose name is the CSV filename (without extension) using PostgreSQL COPY.
 
-def sanitize_column(name: str) -> str:
-    """Sanitize CSV header into a safe SQL identifier (lowercase, underscores).
+    Different tables are loaded concurrently; files that share a table name
+    are loaded one after another so table creation never races.
 
-    Ensures the name doesn't start with a digit and replaces unsafe chars.
+    Tables created by the load are UNLOGGED while COPY runs and switched to
+    LOGGED afterwards. Pass `keep_unlogged=True` to skip that step for
+    scratch loads that will be rebuilt anyway; UNLOGGED tables are truncated
+    after a database crash and are not replicated.
     """
-    name = (name or '').strip()
-    name = name.replace(' ', '_')
-    name = re.sub(r'[^0-9a-zA-Z_]', '_', name)
-    if re.match(r'^[0-9]', name):
-        name = '_' + name
-    return name.lower() or 'col'
+    jobs = find_csv_files(root_dir)
+    if not jobs:
+        return
 
+    pool = create_connection_pool(max_workers)
+    if pool is None:
+        return
 
-def ensure_table_for_csv(path: str, table: str, cur):
-    """Create a table named `table` if it doesn't exist, using the CSV header
-    to define TEXT columns in the same order.
-    """
-    with open(path, newline='', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        header = next(reader, None)
-        if not header:
-            raise ValueError(f"CSV file {path} is empty or has no header")
-
-        cols = []
-        seen = {}
-        for raw in header:
-            col = sanitize_column(raw)
-            base = col
-            i = 1
-            while col in seen:
-                col = f"{base}_{i}"
-                i += 1
-            seen[col] = True
-            cols.append(col)
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(load_table, pool, table, paths, keep_unlogged)
+                for table, paths in jobs.items()
+            ]
+            for future in futures:
+                future.result()
+    finally:
+        pool.closeall()
 
-    # Check if table exists
-    cur.execute("SELECT to_regclass(%s)", (table,))
-    if cur.fetchone()[0]:
-        return
 
-    # Build CREATE TABLE statement with TEXT columns preserving order
-    col_defs = [sql.SQL("{} text").format(sql.Identifier(c)) for c in cols]
-    create_sql = sql.SQL('CREATE TABLE {} (').format(sql.Identifier(table)) + sql.SQL(', ').join(col_defs) + sql.SQL(')')
-    cur.execute(create_sql)
\ No newline at end of file
+if __name__ == '__main__':
+    # Run ingestion from current working directory by default
+    ingest_data('.')
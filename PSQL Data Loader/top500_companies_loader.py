@@ -1,7 +1,7 @@
+import io
 import os
 import pandas as pd
 import psycopg2
-from psycopg2.extras import execute_batch
 from dotenv import load_dotenv
 
 # =========================
@@ -28,24 +28,26 @@ DB_CONFIG = {
 # =========================
 df = pd.read_csv(CSV_PATH)
 
-# Normalize column names
-df.columns = [
-    c.strip().lower()
-     .replace(" ", "_")
-     .replace("(", "")
-     .replace(")", "")
-     .replace("$", "")
-     .replace("%", "")
-    for c in df.columns
-]
+# Normalize column names: spaces become underscores, "()$%" are dropped.
+COLUMN_TRANS = str.maketrans({" ": "_", "(": None, ")": None, "$": None, "%": None})
+df.columns = [c.strip().lower().translate(COLUMN_TRANS) for c in df.columns]
 
 # =========================
 # SAFELY FIND REQUIRED COLUMNS
 # =========================
+# Exact names are checked against a set first; the substring scan only runs
+# when none of the candidates is an exact column name, so an exact "rank"
+# column always beats "fortune_rank".
+columns = list(df.columns)
+column_set = set(columns)
+
 def find_col(possible):
     for p in possible:
-        for c in df.columns:
-            if p == c or p in c:
+        if p in column_set:
+            return p
+    for p in possible:
+        for c in columns:
+            if p in c:
                 return c
     raise KeyError(f"Missing expected column: {possible}")
 
@@ -85,10 +87,12 @@ else:
 cur = conn.cursor()
 
 # =========================
-# UPSERT QUERY
+# STAGING + UPSERT QUERIES
 # =========================
-insert_sql = """
-INSERT INTO top_companies (
+# Rows are streamed into a temp staging table with COPY, then merged into
+# top_companies with a single INSERT ... SELECT upsert. This avoids one
+# round trip (and per-row parameter marshalling) per company.
+columns_sql = """
     name,
     fortune_rank,
     industry,
@@ -99,8 +103,19 @@ INSERT INTO top_companies (
     profit_m,
     market_value_m,
     year
-)
-VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
+"""
+
+stage_sql = """
+CREATE TEMP TABLE stage_top_companies
+    (LIKE top_companies INCLUDING DEFAULTS)
+    ON COMMIT DROP;
+"""
+
+copy_sql = f"COPY stage_top_companies ({columns_sql}) FROM STDIN WITH CSV"
+
+upsert_sql = f"""
+INSERT INTO top_companies ({columns_sql})
+SELECT {columns_sql} FROM stage_top_companies
 ON CONFLICT (name) DO UPDATE SET
     fortune_rank = EXCLUDED.fortune_rank,
     industry = EXCLUDED.industry,
@@ -116,25 +131,31 @@ ON CONFLICT (name) DO UPDATE SET
 # =========================
 # PREPARE ROWS AND BULK INSERT
 # =========================
-rows_to_insert = [
-    (
-        row.get(company_col),
-        row.get(rank_col),
-        row.get(industry_col),
-        row.get(sector_col),
-        row.get(city_col),
-        row.get(state_col),
-        row.get(revenue_col),
-        row.get(profit_col),
-        row.get(market_col),
-        latest_year,
-    )
-    for _, row in df.iterrows()
-]
-
-execute_batch(cur, insert_sql, rows_to_insert, page_size=1000)
+out = df[[
+    company_col,
+    rank_col,
+    industry_col,
+    sector_col,
+    city_col,
+    state_col,
+    revenue_col,
+    profit_col,
+    market_col,
+]].copy()
+out["year"] = latest_year
+
+# Unparseable revenue/profit/market values are NaN after to_numeric. COPY
+# reads an empty CSV field as NULL, which the NOT NULL text columns reject,
+# so write them as "NaN" (what the per-row insert used to store).
+buf = io.StringIO()
+out.to_csv(buf, index=False, header=False, na_rep="NaN")
+buf.seek(0)
+
+cur.execute(stage_sql)
+cur.copy_expert(copy_sql, buf)
+cur.execute(upsert_sql)
 conn.commit()
 cur.close()
 conn.close()
 
-print(f"✅ Imported {len(rows_to_insert)} Fortune 500 companies for year {latest_year} into Neon (top_companies)")
+print(f"✅ Imported {len(out)} Fortune 500 companies for year {latest_year} into Neon (top_companies)")
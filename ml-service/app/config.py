@@ -1,5 +1,7 @@
+import logging
 from pathlib import Path
 
+from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 BASE_DIR = Path(__file__).resolve().parents[1]
@@ -20,6 +22,7 @@ class Settings(BaseSettings):
     ml_limit_metadata_per_hour: int = 180
     ml_limit_lookup_per_hour: int = 240
     ml_limit_global_per_hour: int = 400
+    ml_log_level: str = "WARNING"
 
     model_config = SettingsConfigDict(
         env_file=(
@@ -31,5 +34,13 @@ class Settings(BaseSettings):
         extra="ignore",
     )
 
+    @field_validator("ml_log_level", mode="after")
+    @classmethod
+    def _validate_log_level(cls, value: str) -> str:
+        level = value.strip().upper()
+        if level not in logging.getLevelNamesMapping():
+            raise ValueError(f"unknown log level {value!r}")
+        return level
+
 
 settings = Settings()
@@ -1,16 +1,23 @@
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Any, Callable
 
 import joblib
 import lightgbm as lgb
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.config import settings
 from app.middleware import ml_rate_limit_middleware, ml_service_auth_middleware
+from app.models.salary_inference import prepare_salary_inference
+from app.models.salary_metadata import build_salary_metadata
 
 # Global model registry loaded once at startup.
 model_registry: dict = {}
+# Lookup structures derived from model_registry once it is loaded.
+model_cache: dict = {}
 resolved_model_dir: str = ""
 
 
@@ -28,16 +35,23 @@ def _resolve_model_dir(model_dir: str) -> Path:
     return service_candidate
 
 
+def _load_booster(path: Path) -> lgb.Booster:
+    return lgb.Booster(model_file=str(path))
+
+
 def _load_models(model_dir: str) -> dict:
-    """Load all serialized model artifacts from disk."""
-    registry: dict = {}
+    """Load all serialized model artifacts from disk.
+
+    Artifacts are independent, so they are read and deserialized on a thread
+    pool; file reads and most of the LightGBM/numpy parsing release the GIL.
+    """
     base = _resolve_model_dir(model_dir)
 
     # Salary models
-    for name in ("salary_median", "salary_p10", "salary_p90"):
-        path = base / f"{name}.lgb"
-        if path.exists():
-            registry[name] = lgb.Booster(model_file=str(path))
+    tasks: dict[str, tuple[Path, Callable[[Path], Any]]] = {
+        name: (base / f"{name}.lgb", _load_booster)
+        for name in ("salary_median", "salary_p10", "salary_p90")
+    }
 
     # Encoders and metadata
     for name in (
@@ -48,11 +62,45 @@ def _load_models(model_dir: str) -> dict:
         "salary_titles",
         "salary_premiums",
     ):
-        path = base / f"{name}.joblib"
-        if path.exists():
-            registry[name] = joblib.load(path)
-
-    return registry
+        tasks[name] = (base / f"{name}.joblib", joblib.load)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {
+            name: executor.submit(loader, path)
+            for name, (path, loader) in tasks.items()
+            if path.exists()
+        }
+        return {name: future.result() for name, future in futures.items()}
+
+
+def _prepare_models(registry: dict) -> dict:
+    prepared: dict = {}
+    if all(
+        k in registry
+        for k in (
+            "salary_median",
+            "salary_p10",
+            "salary_p90",
+            "salary_encoders",
+            "salary_feature_columns",
+        )
+    ):
+        prepared["salary"] = prepare_salary_inference(
+            registry["salary_median"],
+            registry["salary_p10"],
+            registry["salary_p90"],
+            registry["salary_encoders"],
+            registry["salary_feature_columns"],
+            registry.get("salary_skill_vocab"),
+            registry.get("salary_premiums"),
+            registry.get("salary_company_scale_meta"),
+        )
+    prepared["salary_metadata"] = build_salary_metadata(
+        registry.get("salary_skill_vocab"),
+        registry.get("salary_titles"),
+        registry.get("salary_company_scale_meta"),
+    )
+    return prepared
 
 
 @asynccontextmanager
@@ -61,10 +109,13 @@ async def lifespan(app: FastAPI):
     resolved_model_dir = str(_resolve_model_dir(settings.model_dir))
     model_registry.clear()
     model_registry.update(_load_models(settings.model_dir))
+    model_cache.clear()
+    model_cache.update(_prepare_models(model_registry))
     loaded = list(model_registry.keys())
     print(f"Model dir: {resolved_model_dir}")
     print(f"Loaded models: {loaded}")
     yield
+    model_cache.clear()
     model_registry.clear()
 
 
@@ -79,6 +130,7 @@ app = FastAPI(
     ),
     version=settings.version,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
     contact={"name": "Job Market Analytics", "url": "https://github.com"},
@@ -1,4 +1,5 @@
-import json
+import hmac
+import logging
 import time
 from typing import Callable
 
@@ -6,7 +7,7 @@ from fastapi import Request
 from fastapi.responses import JSONResponse, Response
 
 from app.config import settings
-from app.middleware.common import get_client_ip, hash_identifier
+from app.middleware.common import event_logger, get_client_ip, hash_identifier, is_exempt_path
 
 
 def _log_auth_event(
@@ -18,9 +19,14 @@ def _log_auth_event(
     reason: str,
     latency_ms: float,
 ) -> None:
-    print(
-        json.dumps(
-            {
+    level = logging.WARNING if blocked else logging.INFO
+    if not event_logger.isEnabledFor(level):
+        return
+    event_logger.log(
+        level,
+        reason,
+        extra={
+            "event": {
                 "component": "ml_service_auth",
                 "path": path,
                 "method": method,
@@ -29,9 +35,8 @@ def _log_auth_event(
                 "blocked": blocked,
                 "reason": reason,
                 "latency_ms": round(latency_ms, 2),
-                "ts": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
             }
-        )
+        },
     )
 
 
@@ -40,7 +45,7 @@ async def ml_service_auth_middleware(
     call_next: Callable[[Request], Response],
 ) -> Response:
     path = request.url.path
-    if not path.startswith("/api/v1") or path == "/api/v1/health":
+    if is_exempt_path(path):
         return await call_next(request)
 
     started = time.perf_counter()
@@ -71,7 +76,8 @@ async def ml_service_auth_middleware(
         return response
 
     provided_key = request.headers.get("x-ml-service-key", "").strip()
-    if provided_key != expected_key:
+    # Constant-time compare; bytes so non-ASCII header values can't raise.
+    if not hmac.compare_digest(provided_key.encode("utf-8"), expected_key.encode("utf-8")):
         response = JSONResponse(
             status_code=401,
             content={
@@ -1,7 +1,22 @@
 import hashlib
+import json
+import logging
+import sys
+import time
+from functools import lru_cache
 
 from fastapi import Request
 
+from app.config import settings
+
+API_PREFIX = "/api/v1"
+EXEMPT_PATHS = frozenset({"/api/v1/health"})
+
+
+def is_exempt_path(path: str) -> bool:
+    """Whether a request path bypasses the auth and rate-limit middlewares."""
+    return path in EXEMPT_PATHS or not path.startswith(API_PREFIX)
+
 
 def get_client_ip(request: Request) -> str:
     forwarded_for = request.headers.get("x-forwarded-for", "").strip()
@@ -20,6 +35,45 @@ def get_client_ip(request: Request) -> str:
     return "unknown"
 
 
+# Client IPs repeat heavily and both middlewares hash them on every request.
+@lru_cache(maxsize=4096)
 def hash_identifier(value: str) -> str:
     return hashlib.sha256(value.encode("utf-8")).hexdigest()[:12]
 
+
+class _JsonEventFormatter(logging.Formatter):
+    """Render a record's `event` dict as one JSON line, stamped from the
+    record's creation time."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Events land many per second; the stamp only has second resolution,
+        # so it is formatted once per second.
+        self._stamp_second = -1
+        self._stamp = ""
+
+    def format(self, record: logging.LogRecord) -> str:
+        second = int(record.created)
+        if second != self._stamp_second:
+            self._stamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(second))
+            self._stamp_second = second
+        payload = dict(getattr(record, "event", {}))
+        payload["ts"] = self._stamp
+        return json.dumps(payload)
+
+
+def _build_event_logger() -> logging.Logger:
+    logger = logging.getLogger("ml_service")
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(_JsonEventFormatter())
+        logger.addHandler(handler)
+        logger.propagate = False
+    logger.setLevel(settings.ml_log_level)
+    return logger
+
+
+# Successful requests are logged at INFO and blocked ones at WARNING. The
+# default ML_LOG_LEVEL=WARNING keeps the per-request hot path log-free;
+# set INFO to log every request.
+event_logger = _build_event_logger()
@@ -1,18 +1,21 @@
 import asyncio
-import json
+import logging
 import math
 import time
-from collections import defaultdict, deque
+from array import array
 from dataclasses import dataclass
 from typing import Callable
 
+import orjson
 from fastapi import Request
 from fastapi.responses import JSONResponse, Response
 
 from app.config import settings
-from app.middleware.common import get_client_ip, hash_identifier
+from app.middleware.common import event_logger, get_client_ip, hash_identifier, is_exempt_path
+from app.schemas.salary import MAX_BATCH_ITEMS
 
 WINDOW_SECONDS = 60 * 60
+SWEEP_INTERVAL_SECONDS = 5 * 60
 HEAVY_ENDPOINTS = {"predict"}
 
 
@@ -26,16 +29,80 @@ class RateLimitResult:
     reset_at_seconds: int
 
 
+class _Bucket:
+    """Fixed-capacity ring buffer of request timestamps, oldest first."""
+
+    __slots__ = ("buf", "head", "count")
+
+    def __init__(self, capacity: int) -> None:
+        self.buf = array("d", bytes(8 * max(1, capacity)))
+        self.head = 0
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def oldest(self) -> float:
+        return self.buf[self.head]
+
+    def at(self, index: int) -> float:
+        return self.buf[(self.head + index) % len(self.buf)]
+
+    def prune(self, boundary: float) -> None:
+        buf = self.buf
+        capacity = len(buf)
+        while self.count and buf[self.head] <= boundary:
+            self.head = (self.head + 1) % capacity
+            self.count -= 1
+
+    def ensure_capacity(self, capacity: int) -> None:
+        if capacity <= len(self.buf):
+            return
+        ordered = [self.buf[(self.head + i) % len(self.buf)] for i in range(self.count)]
+        self.buf = array("d", bytes(8 * capacity))
+        self.buf[: len(ordered)] = array("d", ordered)
+        self.head = 0
+
+    def append(self, value: float, count: int = 1) -> None:
+        # Callers check len(bucket) + count <= limit <= capacity before appending.
+        buf = self.buf
+        capacity = len(buf)
+        for offset in range(self.count, self.count + count):
+            buf[(self.head + offset) % capacity] = value
+        self.count += count
+
+
+def _retry_after(bucket: _Bucket, limit: int, cost: int, now: float) -> int:
+    """Seconds until enough of the oldest timestamps age out to fit `cost` more."""
+    excess = len(bucket) + cost - limit
+    if excess > len(bucket):
+        # More units than the limit allows at all; a full window is the honest wait.
+        return WINDOW_SECONDS
+    return max(1, math.ceil((bucket.at(excess - 1) + WINDOW_SECONDS) - now))
+
+
 class SlidingWindowRateLimiter:
     def __init__(self) -> None:
-        self.buckets: dict[str, deque[float]] = defaultdict(deque)
-        self.lock = asyncio.Lock()
-
-    @staticmethod
-    def _prune(bucket: deque[float], now: float) -> None:
+        self.buckets: dict[str, _Bucket] = {}
+        self._next_sweep = time.time() + SWEEP_INTERVAL_SECONDS
+
+    def _bucket(self, key: str, limit: int) -> _Bucket:
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = _Bucket(limit)
+        else:
+            bucket.ensure_capacity(limit)
+        return bucket
+
+    def _sweep(self, now: float) -> None:
+        """Drop buckets whose timestamps have all aged out of the window."""
         boundary = now - WINDOW_SECONDS
-        while bucket and bucket[0] <= boundary:
-            bucket.popleft()
+        for key in list(self.buckets):
+            bucket = self.buckets[key]
+            bucket.prune(boundary)
+            if not bucket:
+                del self.buckets[key]
+        self._next_sweep = now + SWEEP_INTERVAL_SECONDS
 
     async def check_and_consume(
         self,
@@ -43,72 +110,96 @@ class SlidingWindowRateLimiter:
         endpoint_class: str,
         endpoint_limit: int,
         global_limit: int,
+        cost: int = 1,
     ) -> RateLimitResult:
         now = time.time()
         global_key = f"{client_ip}:global"
         endpoint_key = f"{client_ip}:{endpoint_class}"
 
-        async with self.lock:
-            global_bucket = self.buckets[global_key]
-            endpoint_bucket = self.buckets[endpoint_key]
-
-            self._prune(global_bucket, now)
-            self._prune(endpoint_bucket, now)
-
-            if len(global_bucket) >= global_limit:
-                oldest = global_bucket[0]
-                retry_after = max(1, math.ceil((oldest + WINDOW_SECONDS) - now))
-                return RateLimitResult(
-                    allowed=False,
-                    scope="global",
-                    limit=global_limit,
-                    remaining=0,
-                    retry_after_seconds=retry_after,
-                    reset_at_seconds=int(now + retry_after),
-                )
-
-            if len(endpoint_bucket) >= endpoint_limit:
-                oldest = endpoint_bucket[0]
-                retry_after = max(1, math.ceil((oldest + WINDOW_SECONDS) - now))
-                return RateLimitResult(
-                    allowed=False,
-                    scope="route",
-                    limit=endpoint_limit,
-                    remaining=0,
-                    retry_after_seconds=retry_after,
-                    reset_at_seconds=int(now + retry_after),
-                )
-
-            global_bucket.append(now)
-            endpoint_bucket.append(now)
-
-            remaining = max(0, endpoint_limit - len(endpoint_bucket))
-            reset_at = (
-                int(endpoint_bucket[0] + WINDOW_SECONDS)
-                if endpoint_bucket
-                else int(now + WINDOW_SECONDS)
+        # No await happens between reading and updating the buckets, so this
+        # runs atomically on the event loop without a lock; the method stays
+        # async for API compatibility.
+        if now >= self._next_sweep:
+            self._sweep(now)
+
+        global_bucket = self._bucket(global_key, global_limit)
+        endpoint_bucket = self._bucket(endpoint_key, endpoint_limit)
+
+        boundary = now - WINDOW_SECONDS
+        global_bucket.prune(boundary)
+        endpoint_bucket.prune(boundary)
+
+        if len(global_bucket) + cost > global_limit:
+            retry_after = _retry_after(global_bucket, global_limit, cost, now)
+            return RateLimitResult(
+                allowed=False,
+                scope="global",
+                limit=global_limit,
+                remaining=0,
+                retry_after_seconds=retry_after,
+                reset_at_seconds=int(now + retry_after),
             )
 
+        if len(endpoint_bucket) + cost > endpoint_limit:
+            retry_after = _retry_after(endpoint_bucket, endpoint_limit, cost, now)
             return RateLimitResult(
-                allowed=True,
+                allowed=False,
                 scope="route",
                 limit=endpoint_limit,
-                remaining=remaining,
-                retry_after_seconds=0,
-                reset_at_seconds=reset_at,
+                remaining=0,
+                retry_after_seconds=retry_after,
+                reset_at_seconds=int(now + retry_after),
             )
 
+        global_bucket.append(now, cost)
+        endpoint_bucket.append(now, cost)
+
+        remaining = max(0, endpoint_limit - len(endpoint_bucket))
+        reset_at = int(endpoint_bucket.oldest() + WINDOW_SECONDS)
+
+        return RateLimitResult(
+            allowed=True,
+            scope="route",
+            limit=endpoint_limit,
+            remaining=remaining,
+            retry_after_seconds=0,
+            reset_at_seconds=reset_at,
+        )
+
 
 limiter = SlidingWindowRateLimiter()
-infer_semaphore = asyncio.Semaphore(max(1, settings.ml_max_concurrent_infer))
+_MAX_INFER = max(1, settings.ml_max_concurrent_infer)
+infer_semaphore = asyncio.Semaphore(_MAX_INFER)
+
+
+_ENDPOINT_CLASSES = {
+    ("POST", "/api/v1/salary/predict"): "predict",
+    ("POST", "/api/v1/salary/predict/batch"): "predict",
+    ("GET", "/api/v1/salary/metadata"): "metadata",
+}
+
+
+# Routes that score several predictions per call; they are charged one rate
+# limit unit per item rather than one per request.
+_BATCH_ENDPOINTS = frozenset({("POST", "/api/v1/salary/predict/batch")})
 
 
 def classify_endpoint(method: str, path: str) -> str:
-    if method == "POST" and path == "/api/v1/salary/predict":
-        return "predict"
-    if method == "GET" and path == "/api/v1/salary/metadata":
-        return "metadata"
-    return "lookup"
+    return _ENDPOINT_CLASSES.get((method, path), "lookup")
+
+
+async def request_cost(request: Request) -> int:
+    """Rate-limit units a request consumes: one per prediction it asks for."""
+    if (request.method.upper(), request.url.path) not in _BATCH_ENDPOINTS:
+        return 1
+    try:
+        items = orjson.loads(await request.body()).get("items")
+    except (orjson.JSONDecodeError, AttributeError):
+        # Malformed bodies are rejected by validation without predicting.
+        return 1
+    if not isinstance(items, list) or not items:
+        return 1
+    return min(len(items), MAX_BATCH_ITEMS)
 
 
 def endpoint_limit_for(endpoint_class: str) -> int:
@@ -151,9 +242,14 @@ def _log_rate_event(
     reason: str,
     latency_ms: float,
 ) -> None:
-    print(
-        json.dumps(
-            {
+    level = logging.WARNING if blocked else logging.INFO
+    if not event_logger.isEnabledFor(level):
+        return
+    event_logger.log(
+        level,
+        reason,
+        extra={
+            "event": {
                 "component": "ml_service_rate_limit",
                 "path": path,
                 "method": method,
@@ -163,9 +259,8 @@ def _log_rate_event(
                 "blocked": blocked,
                 "reason": reason,
                 "latency_ms": round(latency_ms, 2),
-                "ts": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
             }
-        )
+        },
     )
 
 
@@ -174,7 +269,7 @@ async def ml_rate_limit_middleware(
     call_next: Callable[[Request], Response],
 ) -> Response:
     path = request.url.path
-    if not path.startswith("/api/v1") or path == "/api/v1/health":
+    if is_exempt_path(path):
         return await call_next(request)
 
     started = time.perf_counter()
@@ -202,12 +297,14 @@ async def ml_rate_limit_middleware(
         )
         return response
 
+    endpoint_limit = endpoint_limit_for(endpoint_class)
     if settings.ml_rate_limit_enabled:
         rate_result = await limiter.check_and_consume(
             client_ip,
             endpoint_class,
-            endpoint_limit_for(endpoint_class),
+            endpoint_limit,
             settings.ml_limit_global_per_hour,
+            await request_cost(request),
         )
         if not rate_result.allowed:
             response = rate_limited_response(
@@ -231,8 +328,8 @@ async def ml_rate_limit_middleware(
         rate_result = RateLimitResult(
             allowed=True,
             scope="route",
-            limit=endpoint_limit_for(endpoint_class),
-            remaining=endpoint_limit_for(endpoint_class),
+            limit=endpoint_limit,
+            remaining=endpoint_limit,
             retry_after_seconds=0,
             reset_at_seconds=int(time.time()) + WINDOW_SECONDS,
         )
@@ -241,7 +338,7 @@ async def ml_rate_limit_middleware(
         if infer_semaphore.locked():
             response = rate_limited_response(
                 retry_after_seconds=5,
-                limit=max(1, settings.ml_max_concurrent_infer),
+                limit=_MAX_INFER,
                 remaining=0,
                 reset_at_seconds=int(time.time()) + 5,
             )
@@ -0,0 +1,96 @@
+import ctypes
+import logging
+
+import lightgbm as lgb
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# SingleRowFast is only reachable through lightgbm.basic internals, which are
+# not a stable API. If a release renames them, predictions go through the
+# public Booster.predict instead of failing at import.
+try:
+    from lightgbm.basic import (
+        _C_API_DTYPE_FLOAT64,
+        _C_API_PREDICT_NORMAL,
+        _LIB,
+        _c_str,
+        _safe_call,
+    )
+except ImportError:
+    _LIB = None
+
+
+class SingleRowPredictor:
+    """Reusable single-row predictor for a loaded LightGBM booster.
+
+    ``Booster.predict`` builds a fresh inner predictor and output buffer on
+    every call. This wraps LightGBM's ``SingleRowFast`` C API instead: the
+    prediction config is initialised once per booster and each call only
+    passes a pointer to a contiguous float64 row.
+
+    An instance reuses its output buffer, so it must not be called from
+    more than one thread at a time. When the installed LightGBM doesn't
+    expose the internals this relies on, it falls back to a single-threaded
+    ``Booster.predict`` on the same row.
+    """
+
+    __slots__ = ("booster", "num_features", "_num_iteration", "_handle", "_out", "_out_len")
+
+    def __init__(self, booster: lgb.Booster, parameters: str = "") -> None:
+        self.booster = booster
+        self.num_features = booster.num_feature()
+        self._num_iteration = booster.best_iteration if booster.best_iteration > 0 else -1
+        self._handle = None
+        self._out = np.zeros(1, dtype=np.float64)
+        self._out_len = ctypes.c_int64(0)
+        if _LIB is not None:
+            try:
+                self._handle = self._init_fast_config(parameters)
+            except AttributeError:
+                pass
+        if self._handle is None:
+            logger.warning("LightGBM SingleRowFast API unavailable; using Booster.predict")
+
+    def _init_fast_config(self, parameters: str) -> ctypes.c_void_p:
+        handle = ctypes.c_void_p()
+        _safe_call(
+            _LIB.LGBM_BoosterPredictForMatSingleRowFastInit(
+                self.booster._handle,
+                ctypes.c_int(_C_API_PREDICT_NORMAL),
+                ctypes.c_int(0),
+                ctypes.c_int(self._num_iteration),
+                ctypes.c_int(_C_API_DTYPE_FLOAT64),
+                ctypes.c_int32(self.num_features),
+                _c_str(parameters),
+                ctypes.byref(handle),
+            )
+        )
+        return handle
+
+    def predict(self, row: np.ndarray) -> float:
+        """Predict one contiguous float64 row of ``num_features`` values."""
+        if row.dtype != np.float64 or row.size != self.num_features or not row.flags.c_contiguous:
+            raise ValueError(f"Expected a contiguous float64 row of {self.num_features} features")
+
+        if self._handle is None:
+            return float(
+                self.booster.predict(
+                    row.reshape(1, -1), num_iteration=self._num_iteration, num_threads=1
+                )[0]
+            )
+
+        _safe_call(
+            _LIB.LGBM_BoosterPredictForMatSingleRowFast(
+                self._handle,
+                row.ctypes.data_as(ctypes.c_void_p),
+                ctypes.byref(self._out_len),
+                self._out.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
+            )
+        )
+        return float(self._out[0])
+
+    def __del__(self) -> None:
+        handle = getattr(self, "_handle", None)
+        if handle is not None and handle.value is not None and _LIB is not None:
+            _LIB.LGBM_FastConfigFree(handle)
@@ -1,9 +1,15 @@
+import os
+from bisect import bisect_left
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import Any
 
 import lightgbm as lgb
 import numpy as np
 import pandas as pd
 
+from app.models.fast_predictor import SingleRowPredictor
 from app.schemas.salary import (
     SalaryAdjustment,
     SalaryFactor,
@@ -23,6 +29,23 @@ EXPERIENCE_ORDINAL = {
     "executive": 5,
 }
 
+# Keys of the per-request feature dict built in _fill_feature_row.
+ROW_FEATURES = (
+    "title",
+    "city",
+    "state",
+    "country",
+    "experience_ordinal",
+    "work_type",
+    "remote_allowed",
+    "has_employee_count",
+    "log_employee_count",
+    "has_company_posting_count",
+    "company_posting_count",
+    "log_company_posting_count",
+    "company_scale_tier_proxy",
+)
+
 DEFAULT_TIER_ORDER = ["micro", "small", "mid", "large", "enterprise"]
 DEFAULT_SCALE_META = {
     "boundaries": [25, 100, 500, 2000],
@@ -36,6 +59,304 @@ DEFAULT_SCALE_META = {
     },
 }
 
+# The three quantile models share one input row and their C++ traversal releases
+# the GIL, so they run in parallel when there is more than one core. On a single
+# vCPU the thread hand-off only adds latency, so they stay sequential.
+_PREDICT_POOL = (
+    ThreadPoolExecutor(max_workers=3, thread_name_prefix="salary-predict")
+    if (os.cpu_count() or 1) > 1
+    else None
+)
+
+# Per-request prediction is one row (or a small batch); OpenMP fork/join costs
+# more than the tree traversal there and would oversubscribe the pool above.
+_PREDICT_PARAMS = {"num_threads": 1}
+
+# Identical requests are common (the form re-submits as users toggle inputs),
+# and inference is deterministic for a loaded model set.
+PREDICTION_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class PremiumTables:
+    """salary_premiums with skill keys reduced to abbreviations and values as floats."""
+
+    role_skill: dict[str, dict[str, float]]
+    global_skill: dict[str, float]
+    role_tier: dict[str, dict[str, float]]
+    global_tier: dict[str, float]
+    skill_weight: float
+    tier_weight: float
+    max_ratio: float
+    max_absolute: float
+
+
+def _flatten_premiums(salary_premiums: Any) -> PremiumTables | None:
+    if not isinstance(salary_premiums, dict):
+        return None
+
+    def skill_map(deltas: dict) -> dict[str, float]:
+        return {
+            key[len("skill_"):]: float(value)
+            for key, value in deltas.items()
+            if key.startswith("skill_")
+        }
+
+    def tier_map(deltas: dict) -> dict[str, float]:
+        return {key: float(value) for key, value in deltas.items()}
+
+    return PremiumTables(
+        role_skill={
+            role: skill_map(deltas)
+            for role, deltas in salary_premiums.get("role_skill_deltas", {}).items()
+        },
+        global_skill=skill_map(salary_premiums.get("global_skill_deltas", {})),
+        role_tier={
+            role: tier_map(deltas)
+            for role, deltas in salary_premiums.get("role_tier_deltas", {}).items()
+        },
+        global_tier=tier_map(salary_premiums.get("global_tier_deltas", {})),
+        skill_weight=float(salary_premiums.get("skill_weight", 1.0)),
+        tier_weight=float(salary_premiums.get("tier_weight", 1.0)),
+        max_ratio=float(salary_premiums.get("max_adjustment_ratio", 0.35)),
+        max_absolute=float(salary_premiums.get("max_absolute_adjustment", 60_000)),
+    )
+
+
+@dataclass(frozen=True)
+class SalaryInferenceCache:
+    """Per-request-invariant state derived once from the loaded salary artifacts."""
+
+    median: SingleRowPredictor
+    p10: SingleRowPredictor
+    p90: SingleRowPredictor
+    feature_index: dict[str, int]
+    # Upper-cased skill vocabulary; None when the vocab artifact is missing.
+    valid_skills: frozenset[str] | None
+    # Row positions of the one-hot columns, keyed by skill abbreviation / industry.
+    skill_col_index: dict[str, int]
+    industry_col_index: dict[str, int]
+    # Row schema: (feature, position) pairs for the target-encoded and plain
+    # numeric request features that the model actually uses.
+    encoded_cols: tuple[str, ...]
+    encoded_positions: tuple[tuple[str, int], ...]
+    numeric_positions: tuple[tuple[str, int], ...]
+    # Category -> encoded value per column, plus the value used for unseen
+    # categories. None when the encoder couldn't be tabulated.
+    encoder_tables: dict[str, dict[str, float]] | None
+    encoder_unseen: dict[str, float]
+    # Gain importances are fixed for a loaded booster, so the reported
+    # factors are the same for every request.
+    factors: tuple[SalaryFactor, ...]
+    premiums: PremiumTables | None
+    # The artifact objects this cache was derived from, in predict_salary
+    # argument order. Responses depend on all of them (company_scale_meta is
+    # read per request), so the LRU below is only valid for these objects.
+    artifacts: tuple[Any, ...] = field(default=(), compare=False, repr=False)
+    # LRU of responses by request fingerprint. It lives on the cache, so a
+    # model reload starts empty. Only touched from the event loop thread.
+    predictions: OrderedDict = field(default_factory=OrderedDict, compare=False, repr=False)
+
+    def built_from(self, artifacts: tuple[Any, ...]) -> bool:
+        return len(artifacts) == len(self.artifacts) and all(
+            a is b for a, b in zip(artifacts, self.artifacts)
+        )
+
+    def cached_prediction(self, key: tuple) -> SalaryPredictionResponse | None:
+        response = self.predictions.get(key)
+        if response is not None:
+            self.predictions.move_to_end(key)
+        return response
+
+    def store_prediction(self, key: tuple, response: SalaryPredictionResponse) -> None:
+        self.predictions[key] = response
+        if len(self.predictions) > PREDICTION_CACHE_SIZE:
+            self.predictions.popitem(last=False)
+
+    def predict_quantiles(self, row: np.ndarray) -> tuple[float, float, float]:
+        if _PREDICT_POOL is None:
+            return self.median.predict(row), self.p10.predict(row), self.p90.predict(row)
+
+        futures = [
+            _PREDICT_POOL.submit(predictor.predict, row)
+            for predictor in (self.median, self.p10, self.p90)
+        ]
+        return futures[0].result(), futures[1].result(), futures[2].result()
+
+
+def _resolve_encoded_columns(target_encoder: Any) -> tuple[str, ...]:
+    if target_encoder is None:
+        return ()
+    if hasattr(target_encoder, "cols") and target_encoder.cols:
+        return tuple(str(c) for c in target_encoder.cols)
+    return ("title", "city", "state", "country", "work_type", "company_scale_tier_proxy")
+
+
+def _build_encoder_tables(
+    target_encoder: Any,
+    cols: tuple[str, ...],
+) -> tuple[dict[str, dict[str, float]], dict[str, float]] | None:
+    """Tabulate a fitted target encoder as plain dict lookups.
+
+    Every category the ordinal step knows about is run through the encoder's
+    own ``transform`` once, alongside an unseen value, so the tables match
+    what per-request ``transform`` calls would return.
+    """
+    try:
+        ordinal_mappings = {
+            str(m["col"]): m["mapping"] for m in target_encoder.ordinal_encoder.mapping
+        }
+        categories = {
+            col: [c for c in ordinal_mappings[col].index if isinstance(c, str)] for col in cols
+        }
+    except (AttributeError, KeyError, TypeError):
+        return None
+
+    unseen = "\x00unseen"
+    while any(unseen in values for values in categories.values()):
+        unseen += "\x00"
+
+    n_rows = max((len(values) for values in categories.values()), default=0) + 1
+    frame = pd.DataFrame(
+        {col: values + [unseen] * (n_rows - len(values)) for col, values in categories.items()}
+    )
+    try:
+        encoded = target_encoder.transform(frame)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+    tables: dict[str, dict[str, float]] = {}
+    unseen_values: dict[str, float] = {}
+    for col, values in categories.items():
+        encoded_col = encoded[col].to_numpy(dtype=np.float64)
+        tables[col] = dict(zip(values, encoded_col[: len(values)].tolist()))
+        unseen_values[col] = float(encoded_col[-1])
+    return tables, unseen_values
+
+
+def _compute_top_factors(model_median: lgb.Booster, top_k: int = 5) -> tuple[SalaryFactor, ...]:
+    importances = model_median.feature_importance(importance_type="gain")
+    feature_names = model_median.feature_name()
+    denom = float(importances.sum()) if float(importances.sum()) > 0 else 1.0
+    sorted_idx = np.argsort(importances)[::-1][:top_k]
+    return tuple(
+        SalaryFactor(
+            feature=feature_names[i],
+            importance=round(float(importances[i] / denom), 4),
+        )
+        for i in sorted_idx
+    )
+
+
+def prepare_salary_inference(
+    model_median: lgb.Booster,
+    model_p10: lgb.Booster,
+    model_p90: lgb.Booster,
+    encoders: dict,
+    feature_columns: list[str],
+    salary_skill_vocab: Any = None,
+    salary_premiums: Any = None,
+    company_scale_meta: Any = None,
+) -> SalaryInferenceCache:
+    """Derive the per-request-invariant lookups from the loaded salary artifacts.
+
+    Build this once per model load and pass it to predict_salary; calls that
+    receive a cache use its tables rather than re-deriving them from the raw
+    artifacts. Responses are only memoized for calls that pass the same
+    artifact objects the cache was built from.
+    """
+    feature_index = {str(col): i for i, col in enumerate(feature_columns)}
+
+    if isinstance(salary_skill_vocab, dict):
+        skill_abrs = [str(s).upper() for s in salary_skill_vocab.get("skill_abrs", [])]
+        valid_skills: frozenset[str] | None = frozenset(skill_abrs)
+    else:
+        skill_abrs = []
+        valid_skills = None
+    skill_col_index = {
+        skill: feature_index[f"skill_{skill}"]
+        for skill in skill_abrs
+        if f"skill_{skill}" in feature_index
+    }
+    industry_col_index = {
+        ind: feature_index[f"ind_{ind}"]
+        for ind in encoders.get("top_industries", [])
+        if f"ind_{ind}" in feature_index
+    }
+
+    target_encoder = encoders.get("target_encoder")
+    encoded_cols = tuple(c for c in _resolve_encoded_columns(target_encoder) if c in ROW_FEATURES)
+    encoded_positions = tuple((c, feature_index[c]) for c in encoded_cols if c in feature_index)
+    numeric_positions = tuple(
+        (key, feature_index[key])
+        for key in ROW_FEATURES
+        if key in feature_index and key not in encoded_cols
+    )
+    tables = _build_encoder_tables(target_encoder, encoded_cols) if encoded_cols else None
+
+    parameters = " ".join(f"{key}={value}" for key, value in _PREDICT_PARAMS.items())
+    return SalaryInferenceCache(
+        median=SingleRowPredictor(model_median, parameters),
+        p10=SingleRowPredictor(model_p10, parameters),
+        p90=SingleRowPredictor(model_p90, parameters),
+        feature_index=feature_index,
+        valid_skills=valid_skills,
+        skill_col_index=skill_col_index,
+        industry_col_index=industry_col_index,
+        encoded_cols=encoded_cols,
+        encoded_positions=encoded_positions,
+        numeric_positions=numeric_positions,
+        encoder_tables=tables[0] if tables else None,
+        encoder_unseen=tables[1] if tables else {},
+        factors=_compute_top_factors(model_median),
+        premiums=_flatten_premiums(salary_premiums),
+        artifacts=(
+            model_median,
+            model_p10,
+            model_p90,
+            encoders,
+            feature_columns,
+            salary_skill_vocab,
+            company_scale_meta,
+            salary_premiums,
+        ),
+    )
+
+
+# Callers that don't hold a prepared cache (anything outside the router) get
+# the one last built for the same artifact objects, so repeated calls don't
+# rebuild the predictors and encoder tables or start from an empty LRU.
+_SHARED_CACHE: SalaryInferenceCache | None = None
+
+
+def _shared_inference_cache(artifacts: tuple[Any, ...]) -> SalaryInferenceCache:
+    """Return the shared cache for these artifacts, in predict_salary argument order."""
+    global _SHARED_CACHE
+    shared = _SHARED_CACHE
+    if shared is not None and shared.built_from(artifacts):
+        return shared
+    (
+        model_median,
+        model_p10,
+        model_p90,
+        encoders,
+        feature_columns,
+        salary_skill_vocab,
+        company_scale_meta,
+        salary_premiums,
+    ) = artifacts
+    shared = _SHARED_CACHE = prepare_salary_inference(
+        model_median,
+        model_p10,
+        model_p90,
+        encoders,
+        feature_columns,
+        salary_skill_vocab,
+        salary_premiums,
+        company_scale_meta,
+    )
+    return shared
+
 
 def _parse_city_state(location: str) -> tuple[str, str]:
     """Split 'City, State' into (city, state)."""
@@ -45,30 +366,21 @@ def _parse_city_state(location: str) -> tuple[str, str]:
     return city.lower(), state.lower()
 
 
-def _resolve_known_skills(skills: list[str], salary_skill_vocab: Any) -> list[str]:
-    if isinstance(salary_skill_vocab, dict):
-        skill_abrs = salary_skill_vocab.get("skill_abrs", [])
-        valid = {str(s).upper() for s in skill_abrs}
-        return [s.upper() for s in skills if s.upper() in valid]
+def _resolve_known_skills(skills: list[str], valid_skills: frozenset[str] | None) -> list[str]:
+    # Request skills arrive upper-cased and de-duplicated (see SalaryPredictionRequest).
+    if valid_skills is not None:
+        return [s for s in skills if s in valid_skills]
 
-    # Backward compatibility: if artifact is missing, just pass through upper-cased skills.
-    return [s.upper() for s in skills]
+    # Backward compatibility: if artifact is missing, just pass through the request skills.
+    return skills
 
 
 def _resolve_tier_from_count(value: float, boundaries: list[int]) -> str:
     if value <= 0:
         return "mid"
 
-    b0, b1, b2, b3 = boundaries
-    if value <= b0:
-        return "micro"
-    if value <= b1:
-        return "small"
-    if value <= b2:
-        return "mid"
-    if value <= b3:
-        return "large"
-    return "enterprise"
+    # Boundaries are inclusive upper bounds for micro..large; past the last is enterprise.
+    return DEFAULT_TIER_ORDER[bisect_left(boundaries, value)]
 
 
 def _resolve_company_scale_tier(
@@ -100,41 +412,34 @@ def _apply_premiums(
     prediction_median: float,
     prediction_p10: float,
     prediction_p90: float,
-    salary_premiums: Any,
+    premiums: PremiumTables | None,
 ) -> tuple[float, float, float, list[SalaryAdjustment]]:
-    if not isinstance(salary_premiums, dict):
+    if premiums is None:
         return prediction_median, prediction_p10, prediction_p90, []
 
     role_key = role_title.lower()
 
-    role_skill_deltas = salary_premiums.get("role_skill_deltas", {})
-    global_skill_deltas = salary_premiums.get("global_skill_deltas", {})
-    role_tier_deltas = salary_premiums.get("role_tier_deltas", {})
-    global_tier_deltas = salary_premiums.get("global_tier_deltas", {})
-
-    skill_weight = float(salary_premiums.get("skill_weight", 1.0))
-    tier_weight = float(salary_premiums.get("tier_weight", 1.0))
-    max_ratio = float(salary_premiums.get("max_adjustment_ratio", 0.35))
-    max_absolute = float(salary_premiums.get("max_absolute_adjustment", 60_000))
-
     per_skill_deltas: list[float] = []
-    role_skill_map = role_skill_deltas.get(role_key, {})
+    role_skill_map = premiums.role_skill.get(role_key, {})
+    global_skill_map = premiums.global_skill
 
     for skill in selected_skills:
-        feature_key = f"skill_{skill}"
-        if feature_key in role_skill_map:
-            per_skill_deltas.append(float(role_skill_map[feature_key]))
-        elif feature_key in global_skill_deltas:
-            per_skill_deltas.append(float(global_skill_deltas[feature_key]))
+        delta = role_skill_map.get(skill)
+        if delta is None:
+            delta = global_skill_map.get(skill)
+        if delta is not None:
+            per_skill_deltas.append(delta)
 
-    skill_delta = (float(np.mean(per_skill_deltas)) if per_skill_deltas else 0.0) * skill_weight
+    # A handful of floats: plain sum/len avoids numpy dispatch for a tiny list.
+    skill_delta = sum(per_skill_deltas) / len(per_skill_deltas) if per_skill_deltas else 0.0
+    skill_delta *= premiums.skill_weight
 
-    role_tier_map = role_tier_deltas.get(role_key, {})
-    tier_delta = float(role_tier_map.get(company_tier, global_tier_deltas.get(company_tier, 0.0)))
-    tier_delta *= tier_weight
+    role_tier_map = premiums.role_tier.get(role_key, {})
+    tier_delta = role_tier_map.get(company_tier, premiums.global_tier.get(company_tier, 0.0))
+    tier_delta *= premiums.tier_weight
 
     total_delta = skill_delta + tier_delta
-    max_allowed = min(max_absolute, abs(prediction_median) * max_ratio)
+    max_allowed = min(premiums.max_absolute, abs(prediction_median) * premiums.max_ratio)
     total_delta = max(-max_allowed, min(max_allowed, total_delta))
 
     adjustments: list[SalaryAdjustment] = []
@@ -151,22 +456,23 @@ def _apply_premiums(
     )
 
 
-def predict_salary(
+def _fill_feature_row(
+    row: np.ndarray,
     req: SalaryPredictionRequest,
-    model_median: lgb.Booster,
-    model_p10: lgb.Booster,
-    model_p90: lgb.Booster,
     encoders: dict,
-    feature_columns: list[str],
-    salary_skill_vocab: Any = None,
-    company_scale_meta: Any = None,
-    salary_premiums: Any = None,
-) -> SalaryPredictionResponse:
+    company_scale_meta: Any,
+    inference_cache: SalaryInferenceCache,
+) -> tuple[list[str], str]:
+    """Write one request's model features into a zeroed row.
+
+    Returns the recognised skills and company tier, which the premium
+    adjustment step needs as well.
+    """
     city, state = _parse_city_state(req.location)
     exp_ord = EXPERIENCE_ORDINAL.get(req.experience_level.strip().lower(), -1)
 
     company_tier, company_posting_count = _resolve_company_scale_tier(req, company_scale_meta)
-    known_skills = _resolve_known_skills(req.skills, salary_skill_vocab)
+    known_skills = _resolve_known_skills(req.skills, inference_cache.valid_skills)
 
     features: dict[str, Any] = {
         "title": req.title.lower(),
@@ -184,46 +490,47 @@ def predict_salary(
         "company_scale_tier_proxy": company_tier,
     }
 
-    req_skills_set = set(known_skills)
+    # Columns the request doesn't set stay 0.
+    if inference_cache.encoder_tables is not None:
+        tables = inference_cache.encoder_tables
+        unseen = inference_cache.encoder_unseen
+        for col, idx in inference_cache.encoded_positions:
+            row[idx] = tables[col].get(features[col], unseen[col])
+    elif inference_cache.encoded_cols:
+        encoded = encoders["target_encoder"].transform(
+            pd.DataFrame([{c: features[c] for c in inference_cache.encoded_cols}])
+        )
+        for col, idx in inference_cache.encoded_positions:
+            row[idx] = encoded[col].iloc[0]
 
-    if isinstance(salary_skill_vocab, dict):
-        skill_abrs = [str(s).upper() for s in salary_skill_vocab.get("skill_abrs", [])]
-    else:
-        skill_abrs = []
+    for key, idx in inference_cache.numeric_positions:
+        row[idx] = features[key]
 
-    for skill in skill_abrs:
-        features[f"skill_{skill}"] = 1 if skill in req_skills_set else 0
+    # One-hot columns default to 0, so only the selected skills and industries are written.
+    skill_col_index = inference_cache.skill_col_index
+    for skill in known_skills:
+        idx = skill_col_index.get(skill)
+        if idx is not None:
+            row[idx] = 1
 
-    top_industries = encoders.get("top_industries", [])
-    req_industries_set = set(req.industries)
-    for ind in top_industries:
-        features[f"ind_{ind}"] = 1 if ind in req_industries_set else 0
+    industry_col_index = inference_cache.industry_col_index
+    for ind in req.industries:
+        idx = industry_col_index.get(ind)
+        if idx is not None:
+            row[idx] = 1
 
-    df = pd.DataFrame([features])
+    return known_skills, company_tier
 
-    target_encoder = encoders.get("target_encoder")
-    if target_encoder is not None:
-        if hasattr(target_encoder, "cols") and target_encoder.cols:
-            cat_cols = [str(c) for c in target_encoder.cols if str(c) in df.columns]
-        else:
-            cat_cols = [
-                c
-                for c in ["title", "city", "state", "country", "work_type", "company_scale_tier_proxy"]
-                if c in df.columns
-            ]
-
-        if cat_cols:
-            df[cat_cols] = target_encoder.transform(df[cat_cols])
-
-    for col in feature_columns:
-        if col not in df.columns:
-            df[col] = 0
-    df = df[feature_columns]
-
-    pred_median = float(model_median.predict(df)[0])
-    pred_p10 = float(model_p10.predict(df)[0])
-    pred_p90 = float(model_p90.predict(df)[0])
 
+def _build_response(
+    req: SalaryPredictionRequest,
+    known_skills: list[str],
+    company_tier: str,
+    pred_median: float,
+    pred_p10: float,
+    pred_p90: float,
+    inference_cache: SalaryInferenceCache,
+) -> SalaryPredictionResponse:
     pred_median, pred_p10, pred_p90, adjustments = _apply_premiums(
         role_title=req.title,
         selected_skills=known_skills,
@@ -231,7 +538,7 @@ def predict_salary(
         prediction_median=pred_median,
         prediction_p10=pred_p10,
         prediction_p90=pred_p90,
-        salary_premiums=salary_premiums,
+        premiums=inference_cache.premiums,
     )
 
     pred_median = max(20_000, min(500_000, pred_median))
@@ -241,23 +548,126 @@ def predict_salary(
     salary_range = pred_p90 - pred_p10
     confidence = max(0.1, min(1.0, 1.0 - (salary_range / max(pred_median, 1.0)) * 0.5))
 
-    importances = model_median.feature_importance(importance_type="gain")
-    feature_names = model_median.feature_name()
-    denom = float(importances.sum()) if float(importances.sum()) > 0 else 1.0
-    sorted_idx = np.argsort(importances)[::-1][:5]
-    factors = [
-        SalaryFactor(
-            feature=feature_names[i],
-            importance=round(float(importances[i] / denom), 4),
-        )
-        for i in sorted_idx
-    ]
-
     return SalaryPredictionResponse(
         predicted_salary=int(round(pred_median)),
         lower_bound=int(round(pred_p10)),
         upper_bound=int(round(pred_p90)),
         confidence=round(confidence, 3),
-        factors=factors,
+        factors=list(inference_cache.factors),
         adjustments=adjustments,
     )
+
+
+def _request_fingerprint(req: SalaryPredictionRequest) -> tuple:
+    # Skill order is kept: it sets the summation order of the premium average.
+    return (
+        req.title.lower(),
+        req.location.lower(),
+        req.country.lower(),
+        req.experience_level.strip().lower(),
+        req.work_type.lower(),
+        req.remote_allowed,
+        req.employee_count,
+        req.company_scale_tier,
+        tuple(req.skills),
+        tuple(sorted(req.industries)),
+    )
+
+
+def predict_salary(
+    req: SalaryPredictionRequest,
+    model_median: lgb.Booster,
+    model_p10: lgb.Booster,
+    model_p90: lgb.Booster,
+    encoders: dict,
+    feature_columns: list[str],
+    salary_skill_vocab: Any = None,
+    company_scale_meta: Any = None,
+    salary_premiums: Any = None,
+    inference_cache: SalaryInferenceCache | None = None,
+) -> SalaryPredictionResponse:
+    artifacts = (
+        model_median,
+        model_p10,
+        model_p90,
+        encoders,
+        feature_columns,
+        salary_skill_vocab,
+        company_scale_meta,
+        salary_premiums,
+    )
+    if inference_cache is None:
+        inference_cache = _shared_inference_cache(artifacts)
+
+    # A cache handed other artifacts than it was built from still supplies
+    # the tables, but its stored responses may not match them.
+    key = _request_fingerprint(req) if inference_cache.built_from(artifacts) else None
+    if key is not None:
+        cached = inference_cache.cached_prediction(key)
+        if cached is not None:
+            return cached
+
+    row = np.zeros(len(inference_cache.feature_index), dtype=np.float64)
+    known_skills, company_tier = _fill_feature_row(
+        row, req, encoders, company_scale_meta, inference_cache
+    )
+    pred_median, pred_p10, pred_p90 = inference_cache.predict_quantiles(row)
+
+    response = _build_response(
+        req, known_skills, company_tier, pred_median, pred_p10, pred_p90, inference_cache
+    )
+    if key is not None:
+        inference_cache.store_prediction(key, response)
+    return response
+
+
+def predict_salary_batch(
+    reqs: list[SalaryPredictionRequest],
+    model_median: lgb.Booster,
+    model_p10: lgb.Booster,
+    model_p90: lgb.Booster,
+    encoders: dict,
+    feature_columns: list[str],
+    salary_skill_vocab: Any = None,
+    company_scale_meta: Any = None,
+    salary_premiums: Any = None,
+    inference_cache: SalaryInferenceCache | None = None,
+) -> list[SalaryPredictionResponse]:
+    """Predict several requests with one matrix prediction per quantile model."""
+    if not reqs:
+        return []
+    artifacts = (
+        model_median,
+        model_p10,
+        model_p90,
+        encoders,
+        feature_columns,
+        salary_skill_vocab,
+        company_scale_meta,
+        salary_premiums,
+    )
+    if inference_cache is None:
+        inference_cache = _shared_inference_cache(artifacts)
+
+    matrix = np.zeros((len(reqs), len(inference_cache.feature_index)), dtype=np.float64)
+    resolved = [
+        _fill_feature_row(matrix[i], req, encoders, company_scale_meta, inference_cache)
+        for i, req in enumerate(reqs)
+    ]
+
+    preds_median = model_median.predict(matrix, **_PREDICT_PARAMS)
+    preds_p10 = model_p10.predict(matrix, **_PREDICT_PARAMS)
+    preds_p90 = model_p90.predict(matrix, **_PREDICT_PARAMS)
+
+    return [
+        _build_response(
+            req,
+            known_skills,
+            company_tier,
+            float(preds_median[i]),
+            float(preds_p10[i]),
+            float(preds_p90[i]),
+            inference_cache,
+        )
+        for i, (req, (known_skills, company_tier)) in enumerate(zip(reqs, resolved))
+    ]
@@ -0,0 +1,86 @@
+import logging
+from typing import Any
+
+import orjson
+from pydantic import BaseModel, ValidationError
+
+from app.models.title_index import TitlePrefixIndex
+from app.schemas.salary import SalaryCompanyScaleTier, SalaryMetadataSkill, SalaryMetadataTitle
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIERS = [
+    {"value": "micro", "label": "Micro (1-25 postings)"},
+    {"value": "small", "label": "Small (26-100 postings)"},
+    {"value": "mid", "label": "Mid (101-500 postings)"},
+    {"value": "large", "label": "Large (501-2000 postings)"},
+    {"value": "enterprise", "label": "Enterprise (2000+ postings)"},
+]
+
+
+def _validated_entries(model: type[BaseModel], entries: list[Any], kind: str) -> list[dict]:
+    """Validate artifact entries one by one, dropping the ones that don't fit.
+
+    The payload is built at startup, so a single malformed entry must not
+    stop the service from booting; it is logged and left out of the response.
+    """
+    valid = []
+    for position, entry in enumerate(entries):
+        try:
+            valid.append(model.model_validate(entry).model_dump())
+        except ValidationError as exc:
+            logger.warning(
+                "Skipping invalid salary metadata %s at index %d: %s",
+                kind,
+                position,
+                exc.errors(include_url=False),
+            )
+    return valid
+
+
+class SalaryMetadataPayload:
+    """Pre-serialized /salary/metadata response around a per-request title list.
+
+    Skills and company scale tiers don't change after load, so they are
+    validated against the response schema and encoded once. Titles are
+    validated when the index is built; each request only encodes its slice.
+    Entries that fail validation are logged and skipped.
+    """
+
+    __slots__ = ("title_index", "_head", "_tail")
+
+    def __init__(self, skills: list[dict], titles: list[dict], company_scale_tiers: list[dict]) -> None:
+        skills_json = orjson.dumps(_validated_entries(SalaryMetadataSkill, skills, "skill"))
+        tiers_json = orjson.dumps(
+            _validated_entries(SalaryCompanyScaleTier, company_scale_tiers, "company scale tier")
+        )
+        self.title_index = TitlePrefixIndex(_validated_entries(SalaryMetadataTitle, titles, "title"))
+        self._head = b'{"skills":' + skills_json + b',"titles":'
+        self._tail = b',"company_scale_tiers":' + tiers_json + b"}"
+
+    def render(self, q: str | None, limit: int) -> bytes:
+        if q:
+            titles = self.title_index.search(q.strip().lower(), limit)
+        else:
+            titles = self.title_index.titles[:limit]
+        return self._head + orjson.dumps(titles) + self._tail
+
+
+def build_salary_metadata(
+    salary_skill_vocab: Any,
+    salary_titles: Any,
+    company_scale_meta: Any,
+) -> SalaryMetadataPayload:
+    if isinstance(salary_skill_vocab, dict):
+        skills = salary_skill_vocab.get("skills", [])
+    else:
+        skills = []
+
+    titles = salary_titles if isinstance(salary_titles, list) else []
+
+    if isinstance(company_scale_meta, dict):
+        company_scale_tiers = company_scale_meta.get("tiers", DEFAULT_TIERS)
+    else:
+        company_scale_tiers = DEFAULT_TIERS
+
+    return SalaryMetadataPayload(skills, titles, company_scale_tiers)
@@ -0,0 +1,29 @@
+from bisect import bisect_left, bisect_right
+from heapq import nsmallest
+
+
+class TitlePrefixIndex:
+    """Prefix search over the salary title list that keeps its original order.
+
+    Titles are stored most-frequent first. A sorted copy of the keys narrows a
+    prefix to a contiguous range in O(log N); the matching entries are then
+    returned in their original (frequency) order.
+    """
+
+    __slots__ = ("titles", "_keys", "_positions")
+
+    def __init__(self, titles: list[dict]) -> None:
+        self.titles = titles
+        self._positions = sorted(range(len(titles)), key=lambda i: str(titles[i].get("title", "")))
+        self._keys = [str(titles[i].get("title", "")) for i in self._positions]
+
+    def search(self, prefix: str, limit: int) -> list[dict]:
+        if not prefix:
+            return self.titles[:limit]
+
+        # Truncating sorted keys to the prefix length keeps them sorted, so the
+        # matches are exactly the run of keys whose truncation equals the prefix.
+        n = len(prefix)
+        lo = bisect_left(self._keys, prefix)
+        hi = bisect_right(self._keys, prefix, lo=lo, key=lambda k: k[:n])
+        return [self.titles[i] for i in nsmallest(limit, self._positions[lo:hi])]
@@ -1,8 +1,11 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 
-from app.main import model_registry
-from app.models.salary_inference import predict_salary
+from app.main import model_cache, model_registry
+from app.models.salary_inference import predict_salary, predict_salary_batch
+from app.models.salary_metadata import build_salary_metadata
 from app.schemas.salary import (
+    SalaryBatchRequest,
+    SalaryBatchResponse,
     SalaryMetadataResponse,
     SalaryPredictionRequest,
     SalaryPredictionResponse,
@@ -10,13 +13,29 @@ from app.schemas.salary import (
 
 router = APIRouter(tags=["salary"])
 
-DEFAULT_TIERS = [
-    {"value": "micro", "label": "Micro (1-25 postings)"},
-    {"value": "small", "label": "Small (26-100 postings)"},
-    {"value": "mid", "label": "Mid (101-500 postings)"},
-    {"value": "large", "label": "Large (501-2000 postings)"},
-    {"value": "enterprise", "label": "Enterprise (2000+ postings)"},
-]
+REQUIRED_SALARY_KEYS = (
+    "salary_median",
+    "salary_p10",
+    "salary_p90",
+    "salary_encoders",
+    "salary_feature_columns",
+)
+
+
+def _salary_model_args() -> tuple:
+    if not all(k in model_registry for k in REQUIRED_SALARY_KEYS):
+        raise HTTPException(status_code=503, detail="Salary models not loaded")
+
+    return (
+        model_registry["salary_median"],
+        model_registry["salary_p10"],
+        model_registry["salary_p90"],
+        model_registry["salary_encoders"],
+        model_registry["salary_feature_columns"],
+        model_registry.get("salary_skill_vocab"),
+        model_registry.get("salary_company_scale_meta"),
+        model_registry.get("salary_premiums"),
+    )
 
 
 @router.post(
@@ -41,28 +60,27 @@ async def salary_predict(req: SalaryPredictionRequest):
     2. Submit this endpoint with at minimum a `title`.
     3. Add `skills`, `experience_level`, and `location` for higher confidence.
     """
-    required_keys = (
-        "salary_median",
-        "salary_p10",
-        "salary_p90",
-        "salary_encoders",
-        "salary_feature_columns",
-    )
-    if not all(k in model_registry for k in required_keys):
-        raise HTTPException(status_code=503, detail="Salary models not loaded")
+    return predict_salary(req, *_salary_model_args(), inference_cache=model_cache.get("salary"))
 
-    result = predict_salary(
-        req,
-        model_registry["salary_median"],
-        model_registry["salary_p10"],
-        model_registry["salary_p90"],
-        model_registry["salary_encoders"],
-        model_registry["salary_feature_columns"],
-        model_registry.get("salary_skill_vocab"),
-        model_registry.get("salary_company_scale_meta"),
-        model_registry.get("salary_premiums"),
+
+@router.post(
+    "/salary/predict/batch",
+    response_model=SalaryBatchResponse,
+    summary="Predict salary ranges for several inputs",
+    response_description="One median/P10/P90 estimate per input item, in request order",
+)
+async def salary_predict_batch(req: SalaryBatchRequest):
+    """
+    Predict salary ranges for up to 25 job postings in one call.
+
+    Each item accepts the same fields as `POST /api/v1/salary/predict` and gets the
+    same response shape. All items are scored with one model call per quantile,
+    which is much cheaper than calling the single endpoint once per item.
+    """
+    results = predict_salary_batch(
+        req.items, *_salary_model_args(), inference_cache=model_cache.get("salary")
     )
-    return result
+    return SalaryBatchResponse(results=results)
 
 
 @router.get(
@@ -86,32 +104,12 @@ async def salary_metadata(
 
     This endpoint does **not** require authentication and is safe to call frequently.
     """
-    skill_vocab = model_registry.get("salary_skill_vocab")
-    if isinstance(skill_vocab, dict):
-        skills = skill_vocab.get("skills", [])
-    else:
-        skills = []
-
-    all_titles = model_registry.get("salary_titles")
-    if isinstance(all_titles, list):
-        titles = all_titles
-    else:
-        titles = []
-
-    if q:
-        q_lower = q.strip().lower()
-        titles = [t for t in titles if str(t.get("title", "")).startswith(q_lower)]
-
-    titles = titles[:limit]
-
-    scale_meta = model_registry.get("salary_company_scale_meta")
-    if isinstance(scale_meta, dict):
-        company_scale_tiers = scale_meta.get("tiers", DEFAULT_TIERS)
-    else:
-        company_scale_tiers = DEFAULT_TIERS
-
-    return SalaryMetadataResponse(
-        skills=skills,
-        titles=titles,
-        company_scale_tiers=company_scale_tiers,
-    )
+    payload = model_cache.get("salary_metadata")
+    if payload is None:
+        payload = build_salary_metadata(
+            model_registry.get("salary_skill_vocab"),
+            model_registry.get("salary_titles"),
+            model_registry.get("salary_company_scale_meta"),
+        )
+    # Pre-serialized: skips per-request pydantic validation of the static lists.
+    return Response(content=payload.render(q, limit), media_type="application/json")
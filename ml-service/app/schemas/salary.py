@@ -1,9 +1,18 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Response models are built once by the service and never mutated afterwards.
+_RESPONSE_CONFIG = ConfigDict(extra="ignore", frozen=True)
+
+# Largest /salary/predict/batch request; each item is charged against the
+# predict rate limit.
+MAX_BATCH_ITEMS = 25
 
 
 class SalaryPredictionRequest(BaseModel):
     """Input schema for salary prediction. Provide at minimum a job title."""
 
+    model_config = ConfigDict(extra="ignore")
+
     title: str = Field(
         ...,
         description="Job title (canonical or variant), e.g. 'Software Engineer'",
@@ -55,10 +64,24 @@ class SalaryPredictionRequest(BaseModel):
         examples=["small", "enterprise"],
     )
 
+    @field_validator("skills", mode="after")
+    @classmethod
+    def _normalize_skills(cls, value: list[str]) -> list[str]:
+        # Skill abbreviations are matched upper-cased; duplicates would be
+        # counted twice by the skill premium.
+        return list(dict.fromkeys(s.strip().upper() for s in value))
+
+    @field_validator("industries", mode="after")
+    @classmethod
+    def _normalize_industries(cls, value: list[str]) -> list[str]:
+        return list(dict.fromkeys(s.strip() for s in value))
+
 
 class SalaryFactor(BaseModel):
     """A single feature contribution to the salary prediction."""
 
+    model_config = _RESPONSE_CONFIG
+
     feature: str = Field(description="Human-readable feature name (e.g. 'Python skill premium')")
     importance: float = Field(description="Relative importance score (0–1 scale, higher = more influential)")
 
@@ -66,6 +89,8 @@ class SalaryFactor(BaseModel):
 class SalaryAdjustment(BaseModel):
     """A post-model salary adjustment applied on top of the base prediction."""
 
+    model_config = _RESPONSE_CONFIG
+
     source: str = Field(description="Adjustment source label (e.g. 'location_premium', 'remote_discount')")
     delta: int = Field(description="Dollar adjustment added to the base prediction (can be negative)")
 
@@ -76,6 +101,8 @@ class SalaryPredictionResponse(BaseModel):
     feature importance breakdown.
     """
 
+    model_config = _RESPONSE_CONFIG
+
     predicted_salary: int = Field(
         description="Median salary prediction in USD/year"
     )
@@ -97,9 +124,34 @@ class SalaryPredictionResponse(BaseModel):
     )
 
 
+class SalaryBatchRequest(BaseModel):
+    """Several salary prediction inputs scored in a single call."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    items: list[SalaryPredictionRequest] = Field(
+        ...,
+        description="Prediction inputs, each with the same fields as /salary/predict",
+        min_length=1,
+        max_length=MAX_BATCH_ITEMS,
+    )
+
+
+class SalaryBatchResponse(BaseModel):
+    """Salary predictions for a batch request."""
+
+    model_config = _RESPONSE_CONFIG
+
+    results: list[SalaryPredictionResponse] = Field(
+        description="One prediction per request item, in the same order"
+    )
+
+
 class SalaryMetadataSkill(BaseModel):
     """A skill available for use in salary predictions."""
 
+    model_config = _RESPONSE_CONFIG
+
     abr: str = Field(description="Skill abbreviation to pass in the 'skills' array of /predict")
     name: str = Field(description="Full human-readable skill name")
     freq: int = Field(description="Number of job postings in training data that required this skill")
@@ -108,6 +160,8 @@ class SalaryMetadataSkill(BaseModel):
 class SalaryMetadataTitle(BaseModel):
     """A job title known to the salary model."""
 
+    model_config = _RESPONSE_CONFIG
+
     title: str = Field(description="Canonical job title string")
     count: int = Field(description="Number of postings in training data with this title")
 
@@ -115,6 +169,8 @@ class SalaryMetadataTitle(BaseModel):
 class SalaryCompanyScaleTier(BaseModel):
     """A company scale tier label for the company_scale_tier field."""
 
+    model_config = _RESPONSE_CONFIG
+
     value: str = Field(description="Machine-readable tier value to pass in requests")
     label: str = Field(description="Human-readable tier label")
 
@@ -125,6 +181,8 @@ class SalaryMetadataResponse(BaseModel):
     available skills, known job titles, and company scale tiers.
     """
 
+    model_config = _RESPONSE_CONFIG
+
     skills: list[SalaryMetadataSkill] = Field(
         description="Skills recognized by the model, sorted by frequency"
     )
@@ -0,0 +1,167 @@
+import asyncio
+import json
+import logging
+import unittest
+from unittest import mock
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.middleware import rate_limit
+from app.middleware.common import _JsonEventFormatter, is_exempt_path
+from app.middleware.rate_limit import (
+    WINDOW_SECONDS,
+    SlidingWindowRateLimiter,
+    classify_endpoint,
+    ml_rate_limit_middleware,
+)
+
+
+class SlidingWindowRateLimiterTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.now = 1_000_000.0
+        patcher = mock.patch.object(rate_limit.time, "time", side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.limiter = SlidingWindowRateLimiter()
+
+    def consume(self, ip: str = "1.2.3.4", endpoint_limit: int = 3, global_limit: int = 10, cost: int = 1):
+        return asyncio.run(
+            self.limiter.check_and_consume(ip, "predict", endpoint_limit, global_limit, cost)
+        )
+
+    def test_route_limit_blocks_until_oldest_request_ages_out(self) -> None:
+        for expected_remaining in (2, 1, 0):
+            result = self.consume()
+            self.assertTrue(result.allowed)
+            self.assertEqual(result.remaining, expected_remaining)
+            self.assertEqual(result.reset_at_seconds, int(1_000_000.0 + WINDOW_SECONDS))
+            self.now += 10
+
+        blocked = self.consume()
+        self.assertFalse(blocked.allowed)
+        self.assertEqual(blocked.scope, "route")
+        self.assertEqual(blocked.retry_after_seconds, WINDOW_SECONDS - 30)
+
+        self.now = 1_000_000.0 + WINDOW_SECONDS
+        result = self.consume()
+        self.assertTrue(result.allowed)
+        self.assertEqual(result.remaining, 0)
+        self.assertEqual(result.reset_at_seconds, int(1_000_010.0 + WINDOW_SECONDS))
+
+    def test_global_limit_applies_across_endpoints(self) -> None:
+        self.assertTrue(self.consume(endpoint_limit=5, global_limit=2).allowed)
+        self.assertTrue(self.consume(endpoint_limit=5, global_limit=2).allowed)
+
+        blocked = self.consume(endpoint_limit=5, global_limit=2)
+        self.assertFalse(blocked.allowed)
+        self.assertEqual(blocked.scope, "global")
+
+    def test_cost_is_charged_per_unit(self) -> None:
+        batch = self.consume(endpoint_limit=40, global_limit=400, cost=25)
+        self.assertTrue(batch.allowed)
+        self.assertEqual(batch.remaining, 15)
+
+        self.now += 10
+        blocked = self.consume(endpoint_limit=40, global_limit=400, cost=25)
+        self.assertFalse(blocked.allowed)
+        self.assertEqual(blocked.scope, "route")
+        self.assertEqual(blocked.retry_after_seconds, WINDOW_SECONDS - 10)
+
+        self.assertEqual(self.consume(endpoint_limit=40, global_limit=400, cost=15).remaining, 0)
+
+    def test_cost_counts_against_global_limit(self) -> None:
+        self.assertTrue(self.consume(endpoint_limit=40, global_limit=30, cost=25).allowed)
+
+        blocked = self.consume(endpoint_limit=40, global_limit=30, cost=10)
+        self.assertFalse(blocked.allowed)
+        self.assertEqual(blocked.scope, "global")
+
+    def test_ring_buffer_wraps_around(self) -> None:
+        for _ in range(20):
+            self.assertTrue(self.consume(endpoint_limit=2).allowed)
+            self.assertTrue(self.consume(endpoint_limit=2).allowed)
+            self.assertFalse(self.consume(endpoint_limit=2).allowed)
+            self.now += WINDOW_SECONDS
+
+    def test_idle_buckets_are_swept(self) -> None:
+        self.consume(ip="10.0.0.1")
+        self.assertIn("10.0.0.1:global", self.limiter.buckets)
+
+        self.now += WINDOW_SECONDS + rate_limit.SWEEP_INTERVAL_SECONDS
+        self.consume(ip="10.0.0.2")
+
+        self.assertNotIn("10.0.0.1:global", self.limiter.buckets)
+        self.assertNotIn("10.0.0.1:predict", self.limiter.buckets)
+        self.assertIn("10.0.0.2:global", self.limiter.buckets)
+
+
+class EndpointClassificationTests(unittest.TestCase):
+    def test_classify_endpoint(self) -> None:
+        self.assertEqual(classify_endpoint("POST", "/api/v1/salary/predict"), "predict")
+        self.assertEqual(classify_endpoint("POST", "/api/v1/salary/predict/batch"), "predict")
+        self.assertEqual(classify_endpoint("GET", "/api/v1/salary/metadata"), "metadata")
+        self.assertEqual(classify_endpoint("GET", "/api/v1/salary/predict"), "lookup")
+        self.assertEqual(classify_endpoint("GET", "/api/v1/clusters"), "lookup")
+
+    def test_exempt_paths(self) -> None:
+        self.assertTrue(is_exempt_path("/api/v1/health"))
+        self.assertTrue(is_exempt_path("/docs"))
+        self.assertFalse(is_exempt_path("/api/v1/salary/predict"))
+
+
+class BatchChargeTests(unittest.TestCase):
+    def setUp(self) -> None:
+        app = FastAPI()
+        app.middleware("http")(ml_rate_limit_middleware)
+
+        @app.post("/api/v1/salary/predict/batch")
+        async def batch(request: Request) -> dict:
+            body = await request.json()
+            return {"items": len(body["items"]) if isinstance(body, dict) else 0}
+
+        for target, value in (
+            ("limiter", SlidingWindowRateLimiter()),
+            ("settings.ml_rate_limit_enabled", True),
+            ("settings.ml_disable_heavy_inference", False),
+            ("settings.ml_limit_predict_per_hour", 40),
+            ("settings.ml_limit_global_per_hour", 400),
+        ):
+            patcher = mock.patch(f"app.middleware.rate_limit.{target}", value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.client = TestClient(app)
+
+    def test_batch_request_uses_one_unit_per_item(self) -> None:
+        response = self.client.post("/api/v1/salary/predict/batch", json={"items": [{"title": "x"}] * 25})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"items": 25})
+        self.assertEqual(response.headers["X-RateLimit-Remaining"], "15")
+
+        blocked = self.client.post("/api/v1/salary/predict/batch", json={"items": [{"title": "x"}] * 25})
+        self.assertEqual(blocked.status_code, 429)
+
+    def test_malformed_batch_body_costs_one_unit(self) -> None:
+        for remaining, body in (("39", [1, 2, 3]), ("38", {"items": "x" * 30})):
+            response = self.client.post("/api/v1/salary/predict/batch", json=body)
+            self.assertEqual(response.headers["X-RateLimit-Remaining"], remaining)
+
+
+class EventFormatterTests(unittest.TestCase):
+    def test_stamp_follows_record_second(self) -> None:
+        formatter = _JsonEventFormatter()
+
+        def render(created: float) -> dict:
+            record = logging.LogRecord("ml_service", logging.INFO, __file__, 0, "ok", None, None)
+            record.created = created
+            record.event = {"status": 200}
+            return json.loads(formatter.format(record))
+
+        self.assertEqual(render(0.25), {"status": 200, "ts": "1970-01-01T00:00:00Z"})
+        self.assertEqual(render(0.75)["ts"], "1970-01-01T00:00:00Z")
+        self.assertEqual(render(61.0)["ts"], "1970-01-01T00:01:01Z")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+from category_encoders import TargetEncoder
+
+import app.main as app_main
+from app.models.fast_predictor import SingleRowPredictor
+from app.models.salary_inference import (
+    _build_encoder_tables,
+    _resolve_tier_from_count,
+    predict_salary,
+    predict_salary_batch,
+)
+from app.schemas.salary import SalaryPredictionRequest
+
+
+class EncoderTableTests(unittest.TestCase):
+    def test_tables_match_transform(self) -> None:
+        train = pd.DataFrame(
+            {
+                "title": ["engineer", "engineer", "nurse", "analyst", "nurse", "engineer"],
+                "city": ["austin", "boston", "austin", "denver", "boston", "austin"],
+            }
+        )
+        target = pd.Series([120_000, 130_000, 80_000, 70_000, 85_000, 125_000])
+        encoder = TargetEncoder(cols=["title", "city"]).fit(train, target)
+
+        tables, unseen = _build_encoder_tables(encoder, ("title", "city"))
+
+        probe = pd.DataFrame(
+            {"title": ["engineer", "nurse", "unseen title"], "city": ["denver", "unseen city", "boston"]}
+        )
+        expected = encoder.transform(probe)
+        for col in ("title", "city"):
+            looked_up = [tables[col].get(value, unseen[col]) for value in probe[col]]
+            self.assertEqual(looked_up, expected[col].tolist())
+
+    def test_untabulated_encoder_returns_none(self) -> None:
+        self.assertIsNone(_build_encoder_tables(object(), ("title",)))
+
+
+class TierFromCountTests(unittest.TestCase):
+    def test_boundaries_are_inclusive_upper_bounds(self) -> None:
+        boundaries = [25, 100, 500, 2000]
+        cases = {
+            1: "micro",
+            25: "micro",
+            26: "small",
+            100: "small",
+            500: "mid",
+            501: "large",
+            2000: "large",
+            2001: "enterprise",
+        }
+        for value, tier in cases.items():
+            self.assertEqual(_resolve_tier_from_count(value, boundaries), tier)
+
+    def test_non_positive_count_defaults_to_mid(self) -> None:
+        self.assertEqual(_resolve_tier_from_count(0, [25, 100, 500, 2000]), "mid")
+
+
+class RequestNormalizationTests(unittest.TestCase):
+    def test_skills_and_industries_are_cleaned_once(self) -> None:
+        req = SalaryPredictionRequest(
+            title="Analyst", skills=[" sql", "SQL", "it "], industries=["14", " 14", "6"]
+        )
+
+        self.assertEqual(req.skills, ["SQL", "IT"])
+        self.assertEqual(req.industries, ["14", "6"])
+
+
+class ModelPredictionTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        registry = app_main._load_models("models")
+        if "salary_median" not in registry:
+            raise unittest.SkipTest("salary model artifacts not available")
+        cls.args = (
+            registry["salary_median"],
+            registry["salary_p10"],
+            registry["salary_p90"],
+            registry["salary_encoders"],
+            registry["salary_feature_columns"],
+            registry.get("salary_skill_vocab"),
+            registry.get("salary_company_scale_meta"),
+            registry.get("salary_premiums"),
+        )
+        cls.cache = app_main._prepare_models(registry)["salary"]
+
+    def fresh_cache(self, **overrides):
+        registry = {
+            "salary_median": self.args[0],
+            "salary_p10": self.args[1],
+            "salary_p90": self.args[2],
+            "salary_encoders": self.args[3],
+            "salary_feature_columns": self.args[4],
+            "salary_skill_vocab": self.args[5],
+            "salary_company_scale_meta": self.args[6],
+            "salary_premiums": self.args[7],
+        }
+        registry.update(overrides)
+        return app_main._prepare_models(registry)["salary"]
+
+    def test_batch_matches_single_predictions(self) -> None:
+        reqs = [
+            SalaryPredictionRequest(title="Software Engineer", skills=["IT", "ENG"]),
+            SalaryPredictionRequest(title="registered nurse", location="Austin, TX", employee_count=5000),
+            SalaryPredictionRequest(title="unknown role", company_scale_tier="micro", remote_allowed=False),
+        ]
+
+        batch = predict_salary_batch(reqs, *self.args, inference_cache=self.cache)
+        single = [predict_salary(req, *self.args, inference_cache=self.cache) for req in reqs]
+
+        self.assertEqual(batch, single)
+
+    def test_repeated_request_is_served_from_cache(self) -> None:
+        req = SalaryPredictionRequest(title="Data Scientist", skills=["IT"])
+        cache = self.fresh_cache()
+
+        first = predict_salary(req, *self.args, inference_cache=cache)
+        again = predict_salary(
+            SalaryPredictionRequest(title="data scientist", skills=["it"]), *self.args, inference_cache=cache
+        )
+
+        self.assertIs(again, first)
+        self.assertEqual(len(cache.predictions), 1)
+
+    def test_changed_artifacts_are_not_served_from_cache(self) -> None:
+        req = SalaryPredictionRequest(title="Software Engineer", employee_count=300)
+        scale_meta = self.args[6] or {}
+        boundaries = list(scale_meta.get("boundaries", [25, 100, 500, 2000]))
+        # Move every boundary so the same count lands in a different tier.
+        shifted = {**scale_meta, "boundaries": [b * 100 for b in boundaries]}
+        shifted_args = self.args[:6] + (shifted,) + self.args[7:]
+        cache = self.fresh_cache()
+
+        first = predict_salary(req, *self.args, inference_cache=cache)
+        changed = predict_salary(req, *shifted_args, inference_cache=cache)
+        expected = predict_salary(
+            req, *shifted_args, inference_cache=self.fresh_cache(salary_company_scale_meta=shifted)
+        )
+
+        self.assertNotEqual(expected, first)
+        self.assertEqual(changed, expected)
+        self.assertIs(predict_salary(req, *self.args, inference_cache=cache), first)
+
+        # Callers without a cache get one keyed on every artifact, scale meta included.
+        self.assertEqual(predict_salary(req, *self.args), first)
+        self.assertEqual(predict_salary(req, *shifted_args), expected)
+
+    def test_changed_encoders_are_not_served_from_cache(self) -> None:
+        req = SalaryPredictionRequest(title="Registered Nurse", location="Austin, TX")
+        encoders = dict(self.args[3])
+        changed_args = self.args[:3] + (encoders,) + self.args[4:]
+        cache = self.fresh_cache()
+
+        first = predict_salary(req, *self.args, inference_cache=cache)
+        again = predict_salary(req, *changed_args, inference_cache=cache)
+
+        self.assertIsNot(again, first)
+        self.assertEqual(len(cache.predictions), 1)
+
+    def test_predictor_falls_back_without_fast_api(self) -> None:
+        booster = self.args[0]
+        row = np.linspace(0.0, 1.0, booster.num_feature())
+        fast = SingleRowPredictor(booster, "num_threads=1")
+
+        with mock.patch("app.models.fast_predictor._LIB", None):
+            fallback = SingleRowPredictor(booster)
+
+        self.assertIsNone(fallback._handle)
+        self.assertAlmostEqual(fallback.predict(row), fast.predict(row), places=6)
+
+    def test_calls_without_cache_reuse_prepared_state(self) -> None:
+        req = SalaryPredictionRequest(title="Accountant", skills=["FIN"])
+
+        first = predict_salary(req, *self.args)
+        again = predict_salary(req, *self.args)
+
+        self.assertIs(again, first)
+        self.assertEqual(first, predict_salary(req, *self.args, inference_cache=self.cache))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+
+import orjson
+
+from app.models.salary_metadata import build_salary_metadata
+from app.models.title_index import TitlePrefixIndex
+
+
+class TitlePrefixIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.titles = [
+            {"title": "software engineer", "count": 50},
+            {"title": "sales manager", "count": 40},
+            {"title": "software developer", "count": 30},
+            {"title": "data scientist", "count": 20},
+            {"title": "software engineer ii", "count": 10},
+        ]
+        self.index = TitlePrefixIndex(self.titles)
+
+    def test_matches_keep_frequency_order(self) -> None:
+        self.assertEqual(
+            [t["title"] for t in self.index.search("soft", 10)],
+            ["software engineer", "software developer", "software engineer ii"],
+        )
+
+    def test_limit_and_empty_prefix(self) -> None:
+        self.assertEqual(self.index.search("s", 2), self.titles[:2])
+        self.assertEqual(self.index.search("", 3), self.titles[:3])
+        self.assertEqual(self.index.search("zz", 5), [])
+
+
+class SalaryMetadataPayloadTests(unittest.TestCase):
+    def test_malformed_entries_are_skipped(self) -> None:
+        vocab = {"skills": [{"abr": "IT", "name": "Information Technology", "freq": 9}, {"abr": "ENG"}]}
+        titles = [{"title": "nurse", "count": 5}, {"title": None, "count": 3}, "analyst"]
+
+        with self.assertLogs("app.models.salary_metadata", level="WARNING") as logs:
+            payload = build_salary_metadata(vocab, titles, None)
+
+        body = orjson.loads(payload.render(None, 10))
+        self.assertEqual([s["abr"] for s in body["skills"]], ["IT"])
+        self.assertEqual(body["titles"], [{"title": "nurse", "count": 5}])
+        self.assertEqual(len(body["company_scale_tiers"]), 5)
+        self.assertEqual(len(logs.output), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
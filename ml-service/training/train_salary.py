@@ -5,6 +5,8 @@ import json
 import os
 import subprocess
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -16,10 +18,19 @@ import pandas as pd
 from category_encoders import TargetEncoder
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import MultiLabelBinarizer
 
 from export_data import export_salary_data, export_salary_skill_vocab
 
 MODEL_DIR = Path(os.getenv("MODEL_DIR", "../models"))
+NUM_THREADS_ENV = "LIGHTGBM_NUM_THREADS"
+MAX_BIN_ENV = "LIGHTGBM_MAX_BIN"
+DEVICE_TYPE_ENV = "LIGHTGBM_DEVICE_TYPE"
+
+# The encoder, premium and title artifacts are several MB of pickled dicts.
+# zlib level 1 cuts them to roughly a third at no measurable load cost, since
+# unpickling rather than the read dominates startup.
+ARTIFACT_COMPRESSION = ("zlib", 1)
 
 EXPERIENCE_ORDINAL = {
     "": -1,
@@ -34,6 +45,16 @@ EXPERIENCE_ORDINAL = {
 }
 
 TIER_ORDER = ["micro", "small", "mid", "large", "enterprise"]
+TIER_DTYPE = pd.CategoricalDtype(TIER_ORDER)
+
+# Raw export columns with a few dozen to a few thousand distinct values. As
+# categoricals they cost a code per row, and string ops run once per category.
+CATEGORICAL_COLUMNS = [
+    "canonical_title",
+    "country",
+    "formatted_experience_level",
+    "formatted_work_type",
+]
 TIER_LABELS = {
     "micro": "Micro (1-25 postings)",
     "small": "Small (26-100 postings)",
@@ -43,38 +64,109 @@ TIER_LABELS = {
 }
 
 
-def _parse_city_state(location: str) -> tuple[str, str]:
-    if not location or pd.isna(location):
-        return "", ""
-    parts = [p.strip() for p in str(location).split(",", 1)]
-    city = parts[0].lower() if parts else ""
-    state = parts[1].lower() if len(parts) > 1 else ""
-    return city, state
-
+_REMOTE_ALLOWED_TEXT = {
+    "true": 1,
+    "t": 1,
+    "yes": 1,
+    "y": 1,
+    "false": 0,
+    "f": 0,
+    "no": 0,
+    "n": 0,
+}
 
-def _coerce_remote_allowed(value: object) -> int:
-    if value is None or pd.isna(value):
-        return -1
 
-    if isinstance(value, bool):
-        return 1 if value else 0
+def _physical_core_count() -> int | None:
+    # LightGBM's histogram construction gains nothing from SMT siblings, so the
+    # default is one thread per physical core available to this process.
+    try:
+        with open("/proc/cpuinfo") as f:
+            cpuinfo = f.read()
+    except OSError:
+        return None
 
-    if isinstance(value, (int, np.integer)):
-        return int(value)
+    cores: set[tuple[str, str]] = set()
+    physical_id = core_id = ""
+    for line in cpuinfo.splitlines() + [""]:
+        key, _, value = line.partition(":")
+        key = key.strip()
+        if key == "physical id":
+            physical_id = value.strip()
+        elif key == "core id":
+            core_id = value.strip()
+        elif not key:
+            if core_id:
+                cores.add((physical_id, core_id))
+            physical_id = core_id = ""
+    if not cores:
+        return None
 
-    if isinstance(value, (float, np.floating)):
-        return int(value)
+    try:
+        available = len(os.sched_getaffinity(0))
+    except AttributeError:
+        available = os.cpu_count() or 1
+    return max(1, min(len(cores), available))
+
+
+def _resolve_num_threads() -> int:
+    configured = os.getenv(NUM_THREADS_ENV, "").strip()
+    if configured:
+        return max(1, int(configured))
+    return _physical_core_count() or os.cpu_count() or 1
+
+
+def _resolve_histogram_params() -> dict[str, Any]:
+    """Optional histogram settings from the environment (LightGBM defaults otherwise).
+
+    A smaller max_bin (63-127) shrinks the histograms split search scans over,
+    and a GPU device offloads histogram construction entirely. Both change the
+    trained models, so they stay opt-in.
+    """
+    params: dict[str, Any] = {}
+
+    max_bin = os.getenv(MAX_BIN_ENV, "").strip()
+    if max_bin:
+        params["max_bin"] = int(max_bin)
+        params["min_data_in_bin"] = 5
+
+    device_type = os.getenv(DEVICE_TYPE_ENV, "").strip().lower()
+    if device_type and device_type != "cpu":
+        params["device_type"] = device_type
+        if device_type == "gpu":
+            params["gpu_use_dp"] = False
+
+    return params
+
+
+def _text_column(df: pd.DataFrame, column: str) -> pd.Series:
+    values = df[column]
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        if "" not in values.cat.categories:
+            values = values.cat.add_categories("")
+        return values.fillna("")
+    return values.fillna("").astype(str)
+
+
+def _parse_city_state(location: pd.Series) -> tuple[pd.Series, pd.Series]:
+    parts = location.str.split(",", n=1, expand=True)
+    if parts.shape[1] == 0:
+        empty = pd.Series("", index=location.index, dtype=object)
+        return empty, empty
+    city = parts[0].fillna("").str.strip().str.lower()
+    if parts.shape[1] > 1:
+        state = parts[1].fillna("").str.strip().str.lower()
+    else:
+        state = pd.Series("", index=location.index, dtype=city.dtype)
+    return city, state
 
-    text = str(value).strip().lower()
-    if text in {"true", "t", "yes", "y"}:
-        return 1
-    if text in {"false", "f", "no", "n"}:
-        return 0
 
-    try:
-        return int(float(text))
-    except (ValueError, TypeError):
-        return -1
+def _coerce_remote_allowed(values: pd.Series) -> pd.Series:
+    # Booleans stringify to "True"/"False", so one text pass covers bool,
+    # numeric and free-text exports alike.
+    text = values.astype(str).str.strip().str.lower()
+    flags = text.map(_REMOTE_ALLOWED_TEXT)
+    numeric = np.trunc(pd.to_numeric(text, errors="coerce"))
+    return flags.fillna(numeric).fillna(-1).astype(np.int8)
 
 
 def _ensure_skill_list(value: object) -> list[str]:
@@ -87,6 +179,11 @@ def _ensure_skill_list(value: object) -> list[str]:
     return []
 
 
+def _ensure_industry_list(value: object) -> list:
+    # Only list values have ever counted towards industry features.
+    return value if isinstance(value, list) else []
+
+
 def _build_skill_vocab(vocab_df: pd.DataFrame) -> tuple[list[dict[str, Any]], list[str]]:
     if vocab_df.empty:
         return [], []
@@ -126,21 +223,13 @@ def _resolve_scale_boundaries(df: pd.DataFrame) -> list[int]:
     return fixed
 
 
-def _posting_count_to_tier(company_posting_count: object, boundaries: list[int]) -> str:
-    value = pd.to_numeric(company_posting_count, errors="coerce")
-    if pd.isna(value) or value <= 0:
-        return "mid"
-
-    b0, b1, b2, b3 = boundaries
-    if value <= b0:
-        return "micro"
-    if value <= b1:
-        return "small"
-    if value <= b2:
-        return "mid"
-    if value <= b3:
-        return "large"
-    return "enterprise"
+def _posting_count_tier_codes(values: np.ndarray, boundaries: list[int]) -> np.ndarray:
+    """Map posting counts to int8 TIER_ORDER indexes; missing or <= 0 counts are mid."""
+    values = np.asarray(values, dtype=np.float64)
+    # side="left" makes each boundary an inclusive upper bound.
+    codes = np.searchsorted(np.asarray(boundaries, dtype=np.float64), values, side="left").astype(np.int8)
+    codes[~(values > 0)] = TIER_ORDER.index("mid")
+    return codes
 
 
 def _build_company_scale_meta(df: pd.DataFrame, boundaries: list[int]) -> dict[str, Any]:
@@ -173,69 +262,109 @@ def build_features(
     boundaries: list[int],
 ) -> pd.DataFrame:
     """Build feature DataFrame from raw exported data."""
-    records: list[dict[str, Any]] = []
-
-    for _, row in df.iterrows():
-        city, state = _parse_city_state(row.get("location", ""))
-        exp = str(row.get("formatted_experience_level", "") or "").lower()
-        exp_ord = EXPERIENCE_ORDINAL.get(exp, -1)
-
-        company_posting_count = pd.to_numeric(row.get("company_posting_count"), errors="coerce")
-        has_company_posting_count = 0 if pd.isna(company_posting_count) else 1
-        posting_count_value = 0.0 if pd.isna(company_posting_count) else float(company_posting_count)
-        company_scale_tier = _posting_count_to_tier(posting_count_value, boundaries)
-
-        feat: dict[str, Any] = {
-            "title": str(row.get("canonical_title", "") or "").lower(),
-            "city": city,
-            "state": state,
-            "experience_ordinal": exp_ord,
-            "work_type": str(row.get("formatted_work_type", "") or "").lower(),
-            "remote_allowed": _coerce_remote_allowed(row.get("remote_allowed")),
-            "company_posting_count": posting_count_value,
-            "log_company_posting_count": float(np.log1p(posting_count_value)) if posting_count_value > 0 else 0.0,
-            "company_scale_tier_proxy": company_scale_tier,
-        }
+    city, state = _parse_city_state(_text_column(df, "location"))
+    exp_ord = (
+        _text_column(df, "formatted_experience_level")
+        .str.lower()
+        .map(EXPERIENCE_ORDINAL)
+        .fillna(-1)
+        .astype(np.int8)
+    )
 
-        skills = _ensure_skill_list(row.get("skills"))
-        for skill in skill_abrs:
-            feat[f"skill_{skill}"] = 1 if skill in skills else 0
+    posting_count = pd.to_numeric(df["company_posting_count"], errors="coerce")
+    posting_count_value = posting_count.fillna(0.0).astype(np.float64)
+    log_posting_count = np.where(
+        posting_count_value > 0,
+        np.log1p(posting_count_value.clip(lower=0)),
+        0.0,
+    )
+    company_scale_tier = np.asarray(TIER_ORDER, dtype=object)[
+        _posting_count_tier_codes(posting_count_value, boundaries)
+    ]
 
-        industries = row.get("industries")
-        if industries is None or (isinstance(industries, float) and pd.isna(industries)):
-            industries = []
+    skills = df["skills"].map(_ensure_skill_list)
+    industries = df["industries"].map(_ensure_industry_list)
+
+    # Fortran order keeps each skill column contiguous when it becomes its own
+    # DataFrame column below.
+    skill_matrix = np.asfortranarray(
+        MultiLabelBinarizer(classes=skill_abrs).fit_transform(skills).astype(np.int8)
+    )
 
-        feat["_industries"] = industries
-        feat["_skills"] = skills
-        feat["_target"] = row["yearly_min_salary"]
-        records.append(feat)
+    columns: dict[str, np.ndarray] = {
+        "title": _text_column(df, "canonical_title").str.lower().to_numpy(),
+        "city": city.to_numpy(),
+        "state": state.to_numpy(),
+        "experience_ordinal": exp_ord.to_numpy(),
+        "work_type": _text_column(df, "formatted_work_type").str.lower().to_numpy(),
+        "remote_allowed": _coerce_remote_allowed(df["remote_allowed"]).to_numpy(),
+        "company_posting_count": posting_count_value.to_numpy(),
+        "log_company_posting_count": log_posting_count,
+        "company_scale_tier_proxy": company_scale_tier,
+    }
+    for position, skill in enumerate(skill_abrs):
+        columns[f"skill_{skill}"] = skill_matrix[:, position]
+    columns["_industries"] = industries.to_numpy()
+    columns["_skills"] = skills.to_numpy()
+    columns["_target"] = df["yearly_min_salary"].to_numpy()
 
-    return pd.DataFrame(records)
+    return pd.DataFrame(columns, copy=False)
 
 
 def add_industry_features(df: pd.DataFrame, top_n: int = 20) -> tuple[pd.DataFrame, list[str]]:
     """Multi-hot encode top N industries."""
-    from collections import Counter
-
-    all_inds = Counter()
-    for inds in df["_industries"]:
-        if isinstance(inds, list):
-            all_inds.update(inds)
-
-    top_industries = [ind for ind, _ in all_inds.most_common(top_n)]
-
-    for ind in top_industries:
-        df[f"ind_{ind}"] = df["_industries"].apply(
-            lambda x: 1 if isinstance(x, list) and ind in x else 0
-        )
-
-    df = df.drop(columns=["_industries"])
-    return df, top_industries
+    industries = df.pop("_industries")
+    exploded = industries.explode().dropna()
+
+    # Stable sort on first-seen counts keeps Counter.most_common's tie order.
+    counts = exploded.value_counts(sort=False).sort_values(ascending=False, kind="stable")
+    top_industries = counts.index[:top_n].tolist()
+
+    if not top_industries:
+        return df, top_industries
+
+    top_rows = exploded[exploded.isin(top_industries)]
+    ind_block = (
+        pd.get_dummies(top_rows)
+        .groupby(level=0)
+        .max()
+        .reindex(index=df.index, columns=top_industries, fill_value=0)
+        .astype(np.int8)
+        .add_prefix("ind_")
+    )
+    return pd.concat([df, ind_block], axis=1), top_industries
+
+
+@dataclass(frozen=True)
+class _RoleTargets:
+    """Salary targets grouped by role, shared by every premium computation."""
+
+    target: np.ndarray
+    role_codes: np.ndarray
+    roles: pd.Index
+    role_rows: list[np.ndarray]
+    role_medians: np.ndarray
+    overall_median: float
+
+
+def _summarize_role_targets(role_column: pd.Series, target: np.ndarray) -> _RoleTargets:
+    target = np.asarray(target, dtype=np.float64)
+    role_codes, roles = pd.factorize(role_column, sort=True)
+    grouped = pd.Series(target).groupby(role_codes)
+    rows = grouped.indices
+    return _RoleTargets(
+        target=target,
+        role_codes=role_codes,
+        roles=roles,
+        role_rows=[rows[code] for code in range(len(roles))],
+        role_medians=grouped.median().to_numpy(),
+        overall_median=float(np.nanmedian(target)),
+    )
 
 
 def _compute_premium_deltas(
     frame: pd.DataFrame,
-    key_column: str,
+    targets: _RoleTargets,
     feature_columns: list[str],
     min_support: int,
     shrinkage: int,
@@ -243,64 +372,68 @@ def _compute_premium_deltas(
     role_deltas: dict[str, dict[str, float]] = {}
     global_deltas: dict[str, float] = {}
 
-    overall_median = float(frame["_target"].median())
-
-    for feature in feature_columns:
-        feature_mask = frame[feature] == 1
-        support = int(feature_mask.sum())
-        if support < min_support:
-            continue
-        raw_delta = float(frame.loc[feature_mask, "_target"].median()) - overall_median
-        weight = support / (support + shrinkage)
-        global_deltas[feature] = raw_delta * weight
-
-    for role, role_frame in frame.groupby("title"):
-        role_median = float(role_frame["_target"].median())
-        feature_delta: dict[str, float] = {}
-
-        for feature in feature_columns:
-            feature_mask = role_frame[feature] == 1
-            support = int(feature_mask.sum())
-            if support < min_support:
-                continue
-            raw_delta = float(role_frame.loc[feature_mask, "_target"].median()) - role_median
-            weight = support / (support + shrinkage)
-            feature_delta[feature] = raw_delta * weight
+    # One long row per (posting, present feature) so every (role, feature)
+    # median comes out of a single groupby instead of a mask per pair.
+    row_idx, feature_idx = np.nonzero(frame[feature_columns].to_numpy() == 1)
+    present = pd.DataFrame(
+        {
+            "role": targets.role_codes[row_idx],
+            "feature": feature_idx,
+            "_target": targets.target[row_idx],
+        }
+    )
 
-        if feature_delta:
-            role_deltas[str(role)] = feature_delta
+    global_stats = present.groupby("feature")["_target"].agg(["median", "size"])
+    global_stats = global_stats[global_stats["size"] >= min_support]
+    global_delta = (global_stats["median"] - targets.overall_median) * (
+        global_stats["size"] / (global_stats["size"] + shrinkage)
+    )
+    for feature, delta in global_delta.items():
+        global_deltas[feature_columns[feature]] = float(delta)
+
+    role_stats = present.groupby(["role", "feature"])["_target"].agg(["median", "size"])
+    role_stats = role_stats[role_stats["size"] >= min_support]
+    baseline = targets.role_medians[role_stats.index.get_level_values("role")]
+    role_delta = (role_stats["median"].to_numpy() - baseline) * (
+        role_stats["size"].to_numpy() / (role_stats["size"].to_numpy() + shrinkage)
+    )
+    for (role, feature), delta in zip(role_stats.index, role_delta):
+        role_deltas.setdefault(str(targets.roles[role]), {})[feature_columns[feature]] = float(delta)
 
     return role_deltas, global_deltas
 
 
 def _compute_tier_premiums(
     frame: pd.DataFrame,
+    targets: _RoleTargets,
     min_support: int,
     shrinkage: int,
 ) -> tuple[dict[str, dict[str, float]], dict[str, float]]:
     role_tier_deltas: dict[str, dict[str, float]] = {}
     global_tier_deltas: dict[str, float] = {}
 
-    overall_median = float(frame["_target"].median())
-    for tier in TIER_ORDER:
-        mask = frame["company_scale_tier_proxy"] == tier
+    target = targets.target
+    tiers = frame["company_scale_tier_proxy"].to_numpy()
+    tier_masks = [(tier, tiers == tier) for tier in TIER_ORDER]
+
+    for tier, mask in tier_masks:
         support = int(mask.sum())
         if support < min_support:
             continue
-        raw_delta = float(frame.loc[mask, "_target"].median()) - overall_median
+        raw_delta = float(np.median(target[mask])) - targets.overall_median
         weight = support / (support + shrinkage)
         global_tier_deltas[tier] = raw_delta * weight
 
-    for role, role_frame in frame.groupby("title"):
-        role_median = float(role_frame["_target"].median())
+    for role, rows, role_median in zip(targets.roles, targets.role_rows, targets.role_medians):
+        role_target = target[rows]
         deltas: dict[str, float] = {}
 
-        for tier in TIER_ORDER:
-            mask = role_frame["company_scale_tier_proxy"] == tier
-            support = int(mask.sum())
+        for tier, mask in tier_masks:
+            role_mask = mask[rows]
+            support = int(role_mask.sum())
             if support < min_support:
                 continue
-            raw_delta = float(role_frame.loc[mask, "_target"].median()) - role_median
+            raw_delta = float(np.median(role_target[role_mask])) - float(role_median)
             weight = support / (support + shrinkage)
             deltas[tier] = raw_delta * weight
 
@@ -313,36 +446,34 @@ def _compute_tier_premiums(
 def build_salary_premiums(
     df: pd.DataFrame,
     skill_abrs: list[str],
+    target: np.ndarray,
 ) -> dict[str, Any]:
-    premiums_df = df[["title", "company_scale_tier_proxy", "_target"]].copy()
-
-    for skill in skill_abrs:
-        feature = f"skill_{skill}"
-        premiums_df[feature] = df[feature]
-
+    """Role/skill/tier salary premiums; only reads ``df``, so no copy is taken."""
+    targets = _summarize_role_targets(df["title"], target)
     role_baselines = {
-        str(role): float(group["_target"].median())
-        for role, group in premiums_df.groupby("title")
+        str(role): float(median)
+        for role, median in zip(targets.roles, targets.role_medians)
     }
 
     skill_features = [f"skill_{skill}" for skill in skill_abrs]
     role_skill_deltas, global_skill_deltas = _compute_premium_deltas(
-        premiums_df,
-        key_column="title",
+        df,
+        targets,
         feature_columns=skill_features,
         min_support=12,
         shrinkage=24,
     )
 
     role_tier_deltas, global_tier_deltas = _compute_tier_premiums(
-        premiums_df,
+        df,
+        targets,
         min_support=20,
         shrinkage=40,
     )
 
     return {
         "role_baselines": role_baselines,
-        "global_baseline": float(premiums_df["_target"].median()),
+        "global_baseline": targets.overall_median,
         "role_skill_deltas": role_skill_deltas,
         "global_skill_deltas": global_skill_deltas,
         "role_tier_deltas": role_tier_deltas,
@@ -354,6 +485,70 @@ def build_salary_premiums(
     }
 
 
+def _fit_salary_model(
+    name: str,
+    params: dict[str, Any],
+    num_boost_round: int,
+    early_stopping_rounds: int,
+    X_train: pd.DataFrame,
+    y_train: np.ndarray,
+    X_test: pd.DataFrame,
+    y_test: np.ndarray,
+) -> tuple[str, lgb.Booster]:
+    # Each model builds its own datasets — min_data_in_leaf differs between the
+    # median and quantile params, and LightGBM freezes dataset params on first
+    # construction. Datasets also can't be pickled into a worker process.
+    lgb_train = lgb.Dataset(X_train, label=y_train, free_raw_data=False)
+    lgb_test = lgb.Dataset(X_test, label=y_test, reference=lgb_train, free_raw_data=False)
+    booster = lgb.train(
+        params,
+        lgb_train,
+        num_boost_round=num_boost_round,
+        valid_sets=[lgb_test],
+        callbacks=[lgb.log_evaluation(100), lgb.early_stopping(early_stopping_rounds)],
+    )
+    return name, booster
+
+
+def _fit_salary_models(
+    fits: list[tuple[str, str, dict[str, Any], int, int]],
+    X_train: pd.DataFrame,
+    y_train: np.ndarray,
+    X_test: pd.DataFrame,
+    y_test: np.ndarray,
+    num_threads: int,
+) -> dict[str, lgb.Booster]:
+    """Fit the median and quantile models, concurrently when cores allow.
+
+    The three objectives are independent and none of them scales across every
+    core on this data size, so with enough cores each gets its own process and
+    an equal share of the thread budget.
+    """
+    data = (X_train, y_train, X_test, y_test)
+    if num_threads < len(fits):
+        models: dict[str, lgb.Booster] = {}
+        for name, label, params, rounds, patience in fits:
+            print(f"\nTraining {label}...")
+            models[name] = _fit_salary_model(name, params, rounds, patience, *data)[1]
+        return models
+
+    threads_per_model = num_threads // len(fits)
+    print(f"\nTraining {len(fits)} models in parallel ({threads_per_model} threads each)...")
+    with ProcessPoolExecutor(max_workers=len(fits)) as pool:
+        futures = [
+            pool.submit(
+                _fit_salary_model,
+                name,
+                {**params, "num_threads": threads_per_model},
+                rounds,
+                patience,
+                *data,
+            )
+            for name, _, params, rounds, patience in fits
+        ]
+        return dict(future.result() for future in futures)
+
+
 def train(
     mlflow_tracking_uri: str | None = None,
     run_name: str | None = None,
@@ -371,9 +566,13 @@ def train(
         print("No salary skill vocabulary found. Aborting.")
         return None
 
+    for column in CATEGORICAL_COLUMNS:
+        raw_df[column] = raw_df[column].astype("category")
+
     boundaries = _resolve_scale_boundaries(raw_df)
-    raw_df["company_scale_tier_proxy"] = raw_df["company_posting_count"].apply(
-        lambda x: _posting_count_to_tier(x, boundaries)
+    posting_counts = pd.to_numeric(raw_df["company_posting_count"], errors="coerce").to_numpy()
+    raw_df["company_scale_tier_proxy"] = pd.Categorical.from_codes(
+        _posting_count_tier_codes(posting_counts, boundaries), dtype=TIER_DTYPE
     )
     scale_meta = _build_company_scale_meta(raw_df, boundaries)
 
@@ -381,14 +580,11 @@ def train(
     feat_df, top_industries = add_industry_features(feat_df)
 
     target = feat_df.pop("_target").values
-    premium_source = feat_df.copy()
-    premium_source["_target"] = target
-
-    salary_premiums = build_salary_premiums(premium_source, skill_abrs)
+    salary_premiums = build_salary_premiums(feat_df, skill_abrs, target)
 
     # _skills is only used to compute diagnostics/premiums.
     if "_skills" in feat_df.columns:
-        feat_df = feat_df.drop(columns=["_skills"])
+        del feat_df["_skills"]
 
     print(f"Features: {feat_df.shape[1]} | Samples: {len(feat_df)}")
     print(
@@ -408,13 +604,11 @@ def train(
 
     feature_columns = list(X_train.columns)
 
-    lgb_train = lgb.Dataset(X_train, label=y_train)
-    lgb_test = lgb.Dataset(X_test, label=y_test, reference=lgb_train)
-
-    # Separate datasets for quantile models — min_data_in_leaf differs from median,
-    # and LightGBM freezes dataset params on first construction.
-    lgb_train_q = lgb.Dataset(X_train, label=y_train, free_raw_data=False)
-    lgb_test_q = lgb.Dataset(X_test, label=y_test, reference=lgb_train_q, free_raw_data=False)
+    num_threads = _resolve_num_threads()
+    print(f"LightGBM threads: {num_threads}")
+    histogram_params = _resolve_histogram_params()
+    if histogram_params:
+        print(f"LightGBM histogram overrides: {histogram_params}")
 
     params_median = {
         "objective": "mae",
@@ -426,7 +620,8 @@ def train(
         "bagging_freq": 5,
         "min_data_in_leaf": 40,
         "verbose": -1,
-        "n_jobs": -1,
+        "num_threads": num_threads,
+        **histogram_params,
     }
 
     params_quantile_base = {
@@ -439,42 +634,19 @@ def train(
         "bagging_freq": 5,
         "min_data_in_leaf": 20,
         "verbose": -1,
-        "n_jobs": -1,
+        "num_threads": num_threads,
+        **histogram_params,
     }
 
     params_p10 = {**params_quantile_base, "alpha": 0.1}
     params_p90 = {**params_quantile_base, "alpha": 0.9}
 
-    models: dict[str, lgb.Booster] = {}
-
-    print("\nTraining median model (MAE)...")
-    models["salary_median"] = lgb.train(
-        params_median,
-        lgb_train,
-        num_boost_round=1500,
-        valid_sets=[lgb_test],
-        callbacks=[lgb.log_evaluation(100), lgb.early_stopping(100)],
-    )
-
-    print("\nTraining P10 model (quantile 0.1)...")
-    models["salary_p10"] = lgb.train(
-        params_p10,
-        lgb_train_q,
-        num_boost_round=800,
-        valid_sets=[lgb_test_q],
-        callbacks=[lgb.log_evaluation(100), lgb.early_stopping(80)],
-    )
-
-    print("\nTraining P90 model (quantile 0.9)...")
-    lgb_train_q90 = lgb.Dataset(X_train, label=y_train, free_raw_data=False)
-    lgb_test_q90 = lgb.Dataset(X_test, label=y_test, reference=lgb_train_q90, free_raw_data=False)
-    models["salary_p90"] = lgb.train(
-        params_p90,
-        lgb_train_q90,
-        num_boost_round=800,
-        valid_sets=[lgb_test_q90],
-        callbacks=[lgb.log_evaluation(100), lgb.early_stopping(80)],
-    )
+    fits = [
+        ("salary_median", "median model (MAE)", params_median, 1500, 100),
+        ("salary_p10", "P10 model (quantile 0.1)", params_p10, 800, 80),
+        ("salary_p90", "P90 model (quantile 0.9)", params_p90, 800, 80),
+    ]
+    models = _fit_salary_models(fits, X_train, y_train, X_test, y_test, num_threads)
 
     preds_median = models["salary_median"].predict(X_test)
     mae = float(mean_absolute_error(y_test, preds_median))
@@ -525,13 +697,11 @@ def train(
         "target_encoder": target_encoder,
         "top_industries": top_industries,
     }
-    joblib.dump(encoders, MODEL_DIR / "salary_encoders.joblib")
+    joblib.dump(encoders, MODEL_DIR / "salary_encoders.joblib", compress=ARTIFACT_COMPRESSION)
     joblib.dump(feature_columns, MODEL_DIR / "salary_feature_columns.joblib")
 
     titles = (
-        raw_df["canonical_title"]
-        .fillna("")
-        .astype(str)
+        _text_column(raw_df, "canonical_title")
         .str.strip()
         .str.lower()
         .value_counts()
@@ -544,8 +714,8 @@ def train(
 
     joblib.dump({"skills": skill_vocab, "skill_abrs": skill_abrs}, MODEL_DIR / "salary_skill_vocab.joblib")
     joblib.dump(scale_meta, MODEL_DIR / "salary_company_scale_meta.joblib")
-    joblib.dump(salary_titles, MODEL_DIR / "salary_titles.joblib")
-    joblib.dump(salary_premiums, MODEL_DIR / "salary_premiums.joblib")
+    joblib.dump(salary_titles, MODEL_DIR / "salary_titles.joblib", compress=ARTIFACT_COMPRESSION)
+    joblib.dump(salary_premiums, MODEL_DIR / "salary_premiums.joblib", compress=ARTIFACT_COMPRESSION)
 
     print("Saved encoders, feature columns, salary vocab, scale metadata, titles, and premiums")
 
@@ -605,6 +775,9 @@ def train(
                 "num_boost_round_quantile": 800,
                 "early_stopping_median": 100,
                 "early_stopping_quantile": 80,
+                "num_threads": num_threads,
+                "max_bin": histogram_params.get("max_bin", 255),
+                "device_type": histogram_params.get("device_type", "cpu"),
                 # Actual iterations
                 "n_iterations_median": models["salary_median"].num_trees(),
                 "n_iterations_p10": models["salary_p10"].num_trees(),
@@ -1,8 +1,13 @@
 import csv
-import re
-from collections import defaultdict
+import os
+from collections import defaultdict, deque
+from collections.abc import Iterable, Iterator
+from contextlib import nullcontext
+from functools import lru_cache
+from multiprocessing import Pool
 
 INPUT_CSV = "C:\\Users\\kaleb\\Downloads\\wispy-block-33237869_production_neondb_2026-01-21_18-04-57.csv"
+WORKERS = int(os.getenv("CANONICAL_WORKERS", os.cpu_count() or 1))
 
 CANONICAL_RULES = {
     # Software / Dev roles
@@ -356,51 +361,188 @@ CANONICAL_RULES = {
 }
 
 def normalize(text: str) -> str:
-    return re.sub(r"\s+", " ", text.lower().strip())
+    # str.split() with no argument splits on the same Unicode whitespace as
+    # \s and drops leading/trailing runs, so this equals lower/strip/collapse.
+    return " ".join(text.lower().split())
 
+# Every (alias, canonical) pair, longest alias first so the most specific
+# alias in a title wins ("certified registered nurse anesthetist" over
+# "registered nurse"). The sort is stable, so equal lengths fall back to rule
+# order. A pair's position in this list is its match priority.
+ALIAS_RULES = sorted(
+    (
+        (alias, canonical)
+        for canonical, aliases in CANONICAL_RULES.items()
+        for alias in aliases
+    ),
+    key=lambda rule: -len(rule[0]),
+)
+NO_MATCH = len(ALIAS_RULES)
+
+# Short aliases ("intern", "cook", "mechanic", "sre") only count as whole
+# words, so "internal auditor" or "mechanical engineer" don't fall into them.
+# Longer aliases are specific enough to match anywhere in the title.
+WORD_BOUNDARY_MAX_LEN = 10
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def build_automaton(
+    aliases: list[str],
+) -> tuple[list[dict[str, int]], list[int], list[tuple[tuple[int, int, bool, bool], ...]]]:
+    # Aho-Corasick automaton over every alias. Each state keeps the best
+    # (lowest) priority among the unrestricted aliases ending there, so a
+    # single walk over a title finds the highest-priority alias it contains.
+    # Word-bounded aliases can't be folded that way, since whether they count
+    # depends on the surrounding characters; each state instead lists the
+    # (priority, length, check_start, check_end) ones ending there, best first.
+    goto: list[dict[str, int]] = [{}]
+    best: list[int] = [NO_MATCH]
+    bounded: list[list[tuple[int, int, bool, bool]]] = [[]]
+    for priority, alias in enumerate(aliases):
+        state = 0
+        for ch in alias:
+            nxt = goto[state].get(ch)
+            if nxt is None:
+                nxt = len(goto)
+                goto[state][ch] = nxt
+                goto.append({})
+                best.append(NO_MATCH)
+                bounded.append([])
+            state = nxt
+        if len(alias) <= WORD_BOUNDARY_MAX_LEN:
+            # Edges that are already punctuation ("crna - prn") need no check.
+            bounded[state].append(
+                (priority, len(alias), _is_word_char(alias[0]), _is_word_char(alias[-1]))
+            )
+        else:
+            best[state] = min(best[state], priority)
+
+    # Fold the failure links into full transition tables (BFS order, so every
+    # failure target is finished first); matching is then one lookup per char.
+    fail = [0] * len(goto)
+    delta: list[dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        best[state] = min(best[state], best[fail[state]])
+        bounded[state] = sorted(bounded[state] + bounded[fail[state]])
+        delta[state] = {**delta[fail[state]], **goto[state]}
+        for ch, child in goto[state].items():
+            fail[child] = delta[fail[state]].get(ch, 0) if state else 0
+            queue.append(child)
+    return delta, best, [tuple(matches) for matches in bounded]
+
+
+TRANSITIONS, BEST_PRIORITY, BOUNDED_MATCHES = build_automaton([alias for alias, _ in ALIAS_RULES])
+
+
+# Titles that normalize to the same string (case and spacing variants) repeat
+# across the export; each worker process keeps its own cache.
+@lru_cache(maxsize=1 << 16)
 def find_canonical(title: str) -> str | None:
-    for canonical, patterns in CANONICAL_RULES.items():
-        for p in patterns:
-            if p in title:
-                return canonical
-    return None
+    state = 0
+    found = NO_MATCH
+    size = len(title)
+    for end, ch in enumerate(title, 1):
+        state = TRANSITIONS[state].get(ch, 0)
+        if BEST_PRIORITY[state] < found:
+            found = BEST_PRIORITY[state]
+        for priority, length, check_start, check_end in BOUNDED_MATCHES[state]:
+            if priority >= found:
+                break
+            start = end - length
+            if check_start and start and _is_word_char(title[start - 1]):
+                continue
+            if check_end and end < size and _is_word_char(title[end]):
+                continue
+            found = priority
+            break
+    return ALIAS_RULES[found][1] if found < NO_MATCH else None
 
-canonical_roles = set()
-role_aliases = []
+BATCH_SIZE = 10_000
 
-with open(INPUT_CSV, newline="", encoding="utf-8") as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        title = normalize(row["normalized_title"])
-        count = int(row["job_count"])
+
+def classify_batch(batch: list[tuple[str, str]]) -> list[tuple[str, str, int]]:
+    aliases = []
+    for raw_title, raw_count in batch:
+        title = normalize(raw_title)
+        count = int(raw_count)
 
         canonical = find_canonical(title)
 
         if canonical:
-            canonical_roles.add(canonical)
-            role_aliases.append({
-                "canonical_name": canonical,
-                "alias": title,
-                "job_count": count,
-            })
-
-# Write canonical_roles.csv
-with open("canonical_roles.csv", "w", newline="", encoding="utf-8") as f:
-    writer = csv.DictWriter(f, fieldnames=["canonical_name"])
-    writer.writeheader()
-    for role in sorted(canonical_roles):
-        writer.writerow({"canonical_name": role})
-
-# Write role_aliases.csv
-with open("role_aliases.csv", "w", newline="", encoding="utf-8") as f:
-    writer = csv.DictWriter(
-        f,
-        fieldnames=["canonical_name", "alias", "job_count"]
-    )
-    writer.writeheader()
-    for row in role_aliases:
-        writer.writerow(row)
-
-print("✅ Canonicalization complete")
-print(f"Roles created: {len(canonical_roles)}")
-print(f"Aliases mapped: {len(role_aliases)}")
+            aliases.append((canonical, title, count))
+    return aliases
+
+
+def read_batches(reader: Iterator[list[str]], title_col: int, count_col: int) -> Iterator[list[tuple[str, str]]]:
+    batch = []
+    for row in reader:
+        if not row:
+            continue
+        batch.append((row[title_col], row[count_col]))
+        if len(batch) >= BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def classify_batches(batches: Iterable[list[tuple[str, str]]], workers: int) -> Iterator[list[tuple[str, str, int]]]:
+    # Rows are independent, so batches fan out to worker processes (each with
+    # its own copy of the automaton). Results come back in input order, and at
+    # most two batches per worker are in flight so memory stays bounded.
+    with Pool(workers) if workers > 1 else nullcontext() as pool:
+        if pool is None:
+            yield from map(classify_batch, batches)
+            return
+
+        pending = deque()
+        for batch in batches:
+            pending.append(pool.apply_async(classify_batch, (batch,)))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+
+
+def main() -> None:
+    canonical_roles = set()
+    alias_count = 0
+
+    # Aliases are written batch by batch as the export is read, so memory stays
+    # flat however large the input is; only the canonical set is kept.
+    with (
+        open(INPUT_CSV, newline="", encoding="utf-8") as f,
+        open("role_aliases.csv", "w", newline="", encoding="utf-8") as aliases_file,
+    ):
+        reader = csv.reader(f)
+        header = next(reader)
+        title_col = header.index("normalized_title")
+        count_col = header.index("job_count")
+
+        writer = csv.writer(aliases_file)
+        writer.writerow(["canonical_name", "alias", "job_count"])
+
+        for aliases in classify_batches(read_batches(reader, title_col, count_col), WORKERS):
+            canonical_roles.update(canonical for canonical, _, _ in aliases)
+            writer.writerows(aliases)
+            alias_count += len(aliases)
+
+    # Write canonical_roles.csv
+    with open("canonical_roles.csv", "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=["canonical_name"])
+        writer.writeheader()
+        for role in sorted(canonical_roles):
+            writer.writerow({"canonical_name": role})
+
+    print("✅ Canonicalization complete")
+    print(f"Roles created: {len(canonical_roles)}")
+    print(f"Aliases mapped: {alias_count}")
+
+
+if __name__ == "__main__":
+    main()